@@ -20,6 +20,7 @@ import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
@@ -83,13 +84,17 @@ def main() -> int:
     filters = load_filters()
 
     since = datetime.now(timezone.utc) - timedelta(hours=args.hours)
-    rows = get_new_jobs_since(since, exclude_handled=True)
-    if not rows:
-        print(f"[daily_digest] no new jobs in last {args.hours}h")
-        return 0
+    # Rows stream from SQLite straight through the filter; only the count is kept.
+    row_count = 0
+
+    def _counted(rows: Iterator[dict]) -> Iterator[dict]:
+        nonlocal row_count
+        for row in rows:
+            row_count += 1
+            yield row
 
     passed = filter_jobs(
-        rows,
+        _counted(get_new_jobs_since(since, exclude_handled=True)),
         locations=filters["locations"],
         level_keywords=filters["level_keywords"],
         title_keywords=filters["title_keywords"],
@@ -107,13 +112,16 @@ def main() -> int:
         newgrad_title_rescue=filters.get("newgrad_title_rescue", True),
         max_yoe_accept=int(filters.get("max_yoe_accept", 3)),
     )
+    if not row_count:
+        print(f"[daily_digest] no new jobs in last {args.hours}h")
+        return 0
     ranked = rank_jobs(passed, location_priority=filters.get("location_priority"))
     annotate_with_keywords(ranked)
     top = ranked[: max(1, int(args.top))]
 
     header = (
         f"Daily digest: top {len(top)} unapplied jobs (last {args.hours}h)"
-        f" | candidate pool: {len(passed)} of {len(rows)} new rows"
+        f" | candidate pool: {len(passed)} of {row_count} new rows"
     )
 
     if args.dry_run:
@@ -6,6 +6,7 @@ to the watchlist for reliable job fetching.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -14,6 +15,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import load_watchlist
+from src.ats._http import SESSION
 from src.ats.detector import detect_ats, detect_ats_from_html
 from src.ats.greenhouse import fetch_jobs as gh_fetch
 from src.ats.lever import fetch_jobs as lever_fetch
@@ -21,54 +23,61 @@ from src.ats.ashby import fetch_jobs as ashby_fetch
 from src.ats.spa_lightpanda import fetch_jobs as spa_fetch
 
 
+# Companies are checked concurrently; each check is dominated by network wait.
+MAX_WORKERS = 16
+
+
+def _count_jobs(ats_type: str, board_id: str) -> int:
+    if ats_type == "greenhouse":
+        return len(gh_fetch(board_id))
+    if ats_type == "lever":
+        return len(lever_fetch(board_id))
+    if ats_type == "ashby":
+        return len(ashby_fetch(board_id))
+    return 0
+
+
+def check_company(entry: dict) -> str:
+    """Detect (or verify) one company's ATS and return its report line."""
+    name = entry.get("name") or "?"
+    url = (entry.get("careers_url") or "").strip()
+    override_type = entry.get("ats_type")
+    override_id = entry.get("board_id")
+    if not url:
+        return f"  {name}: (no URL)"
+    if override_type and override_id:
+        # Verify API works
+        if override_type == "spa":
+            count = len(spa_fetch(override_id))
+        else:
+            count = _count_jobs(override_type, override_id)
+        return f"  {name}: {override_type} / {override_id} (override, {count} jobs)"
+    # Resolve redirect and detect from URL, then from page HTML
+    try:
+        r = SESSION.get(url, timeout=10, allow_redirects=True)
+        final_url = r.url
+        html = r.text
+    except requests.RequestException:
+        final_url = url
+        html = ""
+    ats_type, board_id = detect_ats(final_url)
+    if not board_id and ats_type != "generic":
+        ats_type, board_id = detect_ats(url)
+    if (ats_type == "generic" or not board_id) and html:
+        ats_type, board_id = detect_ats_from_html(html)
+    if board_id:
+        count = _count_jobs(ats_type, board_id)
+        return f"  {name}: {ats_type} / {board_id} (auto, {count} jobs)"
+    return f"  {name}: generic (add ats_type + board_id to watchlist if you know them)"
+
+
 def main() -> None:
     companies = load_watchlist()
     print("ATS detection for watchlist companies\n" + "=" * 60)
-    for entry in companies:
-        name = entry.get("name") or "?"
-        url = (entry.get("careers_url") or "").strip()
-        override_type = entry.get("ats_type")
-        override_id = entry.get("board_id")
-        if not url:
-            print(f"  {name}: (no URL)")
-            continue
-        if override_type and override_id:
-            # Verify API works
-            count = 0
-            if override_type == "greenhouse":
-                count = len(gh_fetch(override_id))
-            elif override_type == "lever":
-                count = len(lever_fetch(override_id))
-            elif override_type == "ashby":
-                count = len(ashby_fetch(override_id))
-            elif override_type == "spa":
-                count = len(spa_fetch(override_id))
-            print(f"  {name}: {override_type} / {override_id} (override, {count} jobs)")
-            continue
-        # Resolve redirect and detect from URL, then from page HTML
-        try:
-            r = requests.get(url, timeout=10, allow_redirects=True, headers={"User-Agent": "GoldGemJobs/1.0"})
-            final_url = r.url
-            html = r.text
-        except requests.RequestException:
-            final_url = url
-            html = ""
-        ats_type, board_id = detect_ats(final_url)
-        if not board_id and ats_type != "generic":
-            ats_type, board_id = detect_ats(url)
-        if (ats_type == "generic" or not board_id) and html:
-            ats_type, board_id = detect_ats_from_html(html)
-        if board_id:
-            count = 0
-            if ats_type == "greenhouse":
-                count = len(gh_fetch(board_id))
-            elif ats_type == "lever":
-                count = len(lever_fetch(board_id))
-            elif ats_type == "ashby":
-                count = len(ashby_fetch(board_id))
-            print(f"  {name}: {ats_type} / {board_id} (auto, {count} jobs)")
-        else:
-            print(f"  {name}: generic (add ats_type + board_id to watchlist if you know them)")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # map() yields in watchlist order, so output stays stable run to run.
+        for line in pool.map(check_company, companies):
+            print(line, flush=True)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@ Run the scraper every SCRAPE_INTERVAL_MINUTES. For 24/7 monitoring.
 Usage: python scripts/run_scheduler.py
 """
 
+import signal
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -14,15 +16,42 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.config import SCRAPE_INTERVAL_MINUTES
 from src.main import run_once
 
+# Floor for the run interval; smaller configured values are raised to this.
+MIN_INTERVAL_SECONDS = 60
+
+_stop_event = threading.Event()
+
+
+def _request_stop(signum, frame) -> None:
+    print(f"Received signal {signum}; stopping after the current run.", flush=True)
+    _stop_event.set()
+
 
 def main() -> int:
-    interval_seconds = max(60, SCRAPE_INTERVAL_MINUTES * 60)
-    while True:
+    interval_seconds = SCRAPE_INTERVAL_MINUTES * 60
+    if interval_seconds < MIN_INTERVAL_SECONDS:
+        print(
+            f"[warn] SCRAPE_INTERVAL_MINUTES={SCRAPE_INTERVAL_MINUTES} is below the "
+            f"{MIN_INTERVAL_SECONDS}s minimum; using {MIN_INTERVAL_SECONDS}s.",
+            flush=True,
+        )
+        interval_seconds = MIN_INTERVAL_SECONDS
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    # Runs are phase-locked to start + k * interval so a slow scrape doesn't push every
+    # later run back. If a run overshoots whole intervals, those ticks are skipped.
+    start = time.monotonic()
+    k = 0
+    while not _stop_event.is_set():
         try:
             run_once()
         except Exception as e:
             print(f"Run failed: {e}", flush=True)
-        time.sleep(interval_seconds)
+        elapsed = time.monotonic() - start
+        k = max(k + 1, int(elapsed // interval_seconds) + 1)
+        _stop_event.wait(max(0.0, start + k * interval_seconds - time.monotonic()))
+    return 0
 
 
 if __name__ == "__main__":
@@ -11,9 +11,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import load_watchlist, load_filters
-from src.ats.greenhouse import fetch_jobs as gh_fetch
-from src.ats.lever import fetch_jobs as lever_fetch
-from src.ats.ashby import fetch_jobs as ashby_fetch
+from src.ats import fetch_jobs_for_companies
 from src.filters import filter_jobs
 
 
@@ -26,11 +24,7 @@ def main() -> None:
     exclude_keywords = filters.get("exclude_keywords")
 
     # Only companies with explicit ATS (the ones we care about for Toronto)
-    with_ats = [
-        (e.get("name"), e.get("ats_type"), e.get("board_id"))
-        for e in companies
-        if e.get("ats_type") and e.get("board_id")
-    ]
+    with_ats = [e for e in companies if e.get("ats_type") and e.get("board_id")]
 
     print("Toronto/Canada job verification (boards + location filter)\n" + "=" * 70)
     print(f"Location keywords (first 8): {locations[:8]}...")
@@ -40,21 +34,11 @@ def main() -> None:
     total_passing = 0
     samples = []
 
-    for name, ats_type, board_id in with_ats:
-        jobs = []
-        try:
-            if ats_type == "greenhouse":
-                jobs = gh_fetch(board_id)
-            elif ats_type == "lever":
-                jobs = lever_fetch(board_id)
-            elif ats_type == "ashby":
-                jobs = ashby_fetch(board_id)
-        except Exception as e:
-            print(f"  {name} ({ats_type}/{board_id}): ERROR - {e}")
-            continue
-
-        for j in jobs:
-            j["company_name"] = name
+    # All boards are fetched concurrently up front; results come back in watchlist order.
+    for entry, jobs in fetch_jobs_for_companies(with_ats):
+        name = entry.get("name")
+        # Filters work on row-shaped dicts (as read back from the DB), which carry company_name.
+        jobs = [{**j._asdict(), "company_name": name} for j in jobs]
 
         filtered = filter_jobs(
             jobs,
@@ -1,6 +1,10 @@
 # ATS-specific fetchers and detector
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.ats._http import POOL_MAXSIZE
 from src.ats.detector import detect_ats, detect_ats_from_html
+from src.ats.job import Job
 from src.ats.greenhouse import fetch_jobs as greenhouse_fetch
 from src.ats.lever import fetch_jobs as lever_fetch
 from src.ats.ashby import fetch_jobs as ashby_fetch
@@ -13,11 +17,15 @@ from src.ats.spa_lightpanda import fetch_jobs as spa_lightpanda_fetch
 from src.ats.workable import fetch_jobs as workable_fetch
 from src.ats.workday import fetch_jobs as workday_fetch
 
+# Boards are fetched on threads (the GIL is released during socket I/O). Kept well below
+# the shared session's pool size and low enough not to hammer one API host.
+MAX_FETCH_WORKERS = min(16, POOL_MAXSIZE)
+
 
-def fetch_jobs_for_company(ats_type: str, board_id: str | None, careers_url: str) -> list[dict]:
+def fetch_jobs_for_company(ats_type: str, board_id: str | None, careers_url: str) -> list[Job]:
     """
-    Dispatch to the right fetcher. Returns list of normalized jobs:
-    id, title, location, department, url, posted_at.
+    Dispatch to the right fetcher. Returns list of normalized jobs (Job):
+    id, title, location, department, url, posted_at, description.
     """
     if ats_type == "greenhouse" and board_id:
         return greenhouse_fetch(board_id)
@@ -44,3 +52,31 @@ def fetch_jobs_for_company(ats_type: str, board_id: str | None, careers_url: str
         jobs = spa_lightpanda_fetch(board_id)
         return jobs if jobs else generic_fetch(careers_url)
     return generic_fetch(careers_url)
+
+
+def fetch_jobs_for_companies(entries: list[dict]) -> list[tuple[dict, list[Job]]]:
+    """
+    Fetch jobs for many watchlist entries concurrently.
+    Each entry needs ats_type / board_id / careers_url (as for fetch_jobs_for_company).
+    Returns (entry, jobs) pairs in the same order as ``entries``.
+    """
+    if not entries:
+        return []
+    results: list[list[Job]] = [[] for _ in entries]
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(
+                fetch_jobs_for_company,
+                e.get("ats_type") or "generic",
+                e.get("board_id"),
+                (e.get("careers_url") or "").strip(),
+            ): i
+            for i, e in enumerate(entries)
+        }
+        for fut in as_completed(futures):
+            i = futures[fut]
+            try:
+                results[i] = fut.result()
+            except Exception as e:
+                print(f"[warn] fetch failed: {entries[i].get('name') or '?'}: {e}", flush=True)
+    return list(zip(entries, results))
@@ -1,78 +1,72 @@
 """Fetch jobs from Ashby job board API (public JSON)."""
 
+import orjson
 import requests
-from typing import Any
+import sys
+
+from src.ats._http import get_parsed
+from src.ats.job import Job, add_location, add_locations_from_list
 
 TIMEOUT = 15
 
-JobDict = dict[str, Any]
 
+def _add_location_from_dict(loc_map: dict[str, str], loc: dict) -> None:
+    add_location(loc_map, loc.get("name") or loc.get("value"))
+
+
+# Primary location shapes, keyed on exact JSON type: one dict lookup per job instead of an
+# isinstance chain. Anything else (a plain string) is added as-is.
+_LOCATION_HANDLERS = {list: add_locations_from_list, dict: _add_location_from_dict}
 
-def fetch_jobs(client_name: str) -> list[JobDict]:
+
+def fetch_jobs(client_name: str) -> list[Job]:
     """
     Fetch all jobs for an Ashby job board.
     GET https://api.ashbyhq.com/posting-api/job-board/<clientname>
     """
     url = f"https://api.ashbyhq.com/posting-api/job-board/{client_name}"
     try:
-        r = requests.get(url, timeout=TIMEOUT)
-        r.raise_for_status()
-        data = r.json()
+        return list(get_parsed(url, _parse_jobs, timeout=TIMEOUT))
     except (requests.RequestException, ValueError):
         return []
+
+
+def _parse_jobs(content: bytes) -> list[Job]:
+    data = orjson.loads(content)
     # Ashby returns { "jobs": [ ... ] } or similar
     jobs = data.get("jobs") if isinstance(data, dict) else []
     if not isinstance(jobs, list):
         return []
-    out: list[JobDict] = []
+    out: list[Job] = []
     for j in jobs:
         if not isinstance(j, dict):
             continue
         # Ashby: primary location + secondaryLocations (multi-location jobs)
         loc = j.get("location") or j.get("locationName")
-        location_parts: list[str] = []
-        if isinstance(loc, list):
-            for x in loc:
-                if isinstance(x, dict):
-                    p = x.get("name") or x.get("location") or x.get("value")
-                    if p is not None and str(p).strip():
-                        location_parts.append(str(p).strip())
-                elif x is not None and str(x).strip():
-                    location_parts.append(str(x).strip())
-        elif isinstance(loc, dict):
-            p = loc.get("name") or loc.get("value")
-            if p:
-                location_parts.append(str(p).strip())
+        loc_map: dict[str, str] = {}
+        handler = _LOCATION_HANDLERS.get(type(loc))
+        if handler is not None:
+            handler(loc_map, loc)
         elif loc:
-            location_parts.append(str(loc).strip())
+            add_location(loc_map, loc)
         for sec in j.get("secondaryLocations") or []:
             if isinstance(sec, dict):
-                s = sec.get("location") or sec.get("name") or sec.get("value")
+                add_location(loc_map, sec.get("location") or sec.get("name") or sec.get("value"))
             else:
-                s = sec
-            if s and str(s).strip():
-                location_parts.append(str(s).strip())
-        # Dedupe by normalized form (first occurrence wins)
-        seen: set[str] = set()
-        unique = []
-        for p in location_parts:
-            if not p:
-                continue
-            k = p.lower().strip()
-            if k not in seen:
-                seen.add(k)
-                unique.append(p)
-        loc = " | ".join(unique) if unique else None
+                add_location(loc_map, sec)
+        # Keys are normalized forms, so this is already deduped (first occurrence wins)
+        loc = " | ".join(loc_map.values()) or None
+        department = j.get("department")
         url = j.get("url") or j.get("applicationUrl") or j.get("jobUrl")
         raw_id = j.get("id")
         description = j.get("descriptionPlain") or (j.get("descriptionHtml") if isinstance(j.get("descriptionHtml"), str) else None)
-        out.append({
-            "id": str(raw_id) if raw_id is not None else url,
-            "title": j.get("title"),
-            "location": loc,
-            "department": j.get("department"),
-            "url": url,
-            "posted_at": j.get("publishedAt") or j.get("createdAt"),
-            "description": description,
-        })
+        out.append(Job(
+            id=str(raw_id) if raw_id is not None else url,
+            title=j.get("title"),
+            location=sys.intern(loc) if loc else None,
+            department=sys.intern(department) if isinstance(department, str) else department,
+            url=url,
+            posted_at=j.get("publishedAt") or j.get("createdAt"),
+            description=description,
+        ))
     return out
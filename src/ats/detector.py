@@ -1,6 +1,11 @@
 """Map career URL to ATS type and board token/slug."""
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterator
 from urllib.parse import urlparse
 
 # (ats_type, board_id or None if not detectable)
@@ -49,6 +54,36 @@ RECRUITEE_RE = re.compile(r"([a-z0-9-]+)\.recruitee\.com", re.I)
 # iCIMS: jobs-<tenant>.icims.com or careers-<tenant>.icims.com or <tenant>.icims.com.
 ICIMS_RE = re.compile(r"(?:careers-|jobs-)?([a-z0-9-]+)\.icims\.com", re.I)
 
+# Literal substrings (lowercase) that the patterns above can't match without.
+_MARKERS = ("greenhouse.io", "jobvite.com", "boardtoken", "lever.co", "ashbyhq.com", "smartrecruiters.com")
+
+
+def _marker_for(pattern: re.Pattern) -> str:
+    literal = pattern.pattern.replace("\\", "").lower()
+    return next(m for m in _MARKERS if m in literal)
+
+
+# (pattern, ats_type, group, marker), flattened in detection priority order with Greenhouse
+# (the most common ATS on the watchlist) first. A substring test per marker replaces a regex
+# pass per pattern on pages that never mention the ATS (the common case). A single
+# alternation regex was measured ~2x slower than the separate patterns: sre loses the
+# per-pattern literal-prefix scan on an alternation.
+_ALL_PATTERNS: tuple[tuple[re.Pattern, str, int, str], ...] = tuple(
+    (pattern, ats_type, group, _marker_for(pattern))
+    for pattern, ats_type, group in (
+        GREENHOUSE_PATTERNS + LEVER_PATTERNS + ASHBY_PATTERNS + SMARTRECRUITERS_PATTERNS
+    )
+)
+
+
+def _iter_pattern_matches(text: str, present: set[str]) -> Iterator[tuple[str, str]]:
+    """Yield (ats_type, raw group) for each pattern in _ALL_PATTERNS that matches text."""
+    for pattern, ats_type, group, marker in _ALL_PATTERNS:
+        if marker in present:
+            m = pattern.search(text)
+            if m:
+                yield ats_type, m.group(group)
+
 
 def _detect_workable(text: str) -> Result | None:
     for pattern, ats_type, group in WORKABLE_PATTERNS:
@@ -104,6 +139,41 @@ def _detect_jazzhr(text: str) -> Result | None:
     return "jazzhr", sub
 
 
+# Subdomain-style detectors in priority order, each with the host literal its regex needs.
+# Their `[a-z0-9-]+\.host` patterns retry at every offset (superlinear on long word-character
+# runs), so skipping them when the host never appears saves the most time of any gate here.
+_HOST_DETECTORS = (
+    ("myworkdayjobs.com", _detect_workday),
+    ("applytojob.com", _detect_jazzhr),
+    ("workable.com", _detect_workable),
+    ("recruitee.com", _detect_recruitee),
+    ("icims.com", _detect_icims),
+)
+_ALL_MARKERS = _MARKERS + tuple(marker for marker, _ in _HOST_DETECTORS)
+
+
+def _markers_present(lowered: str) -> set[str]:
+    """One substring test per ATS marker; an empty set means no detector can match."""
+    return {marker for marker in _ALL_MARKERS if marker in lowered}
+
+
+def _detect_hosts(text: str, present: set[str]) -> Result | None:
+    for marker, detect in _HOST_DETECTORS:
+        if marker in present:
+            found = detect(text)
+            if found is not None:
+                return found
+    return None
+
+
+# Career pages rarely change between scheduler runs, so scan results are memoized by a
+# digest of the scanned text. OrderedDict gives LRU eviction; the lock covers callers
+# resolving companies on a thread pool.
+HTML_CACHE_SIZE = 256
+_HTML_CACHE: OrderedDict[bytes, Result] = OrderedDict()
+_HTML_CACHE_LOCK = threading.Lock()
+
+
 def detect_ats_from_html(html: str) -> Result:
     """
     Scan page content for ATS links or script config (e.g. Greenhouse embed).
@@ -112,48 +182,32 @@ def detect_ats_from_html(html: str) -> Result:
     if not html:
         return "generic", None
     text = html[:200_000]  # limit scan size
-    for pattern, ats_type, group in GREENHOUSE_PATTERNS:
-        m = pattern.search(text)
-        if m:
-            board_id = m.group(group).strip("'\"").split("?")[0].rstrip("/")
-            if board_id and len(board_id) < 80:
-                return ats_type, board_id
-    for pattern, ats_type, group in LEVER_PATTERNS:
-        m = pattern.search(text)
-        if m:
-            board_id = m.group(group).strip("'\"").split("?")[0].rstrip("/")
-            if board_id and len(board_id) < 80:
-                return ats_type, board_id
-    for pattern, ats_type, group in ASHBY_PATTERNS:
-        m = pattern.search(text)
-        if m:
-            board_id = m.group(group).strip("'\"").split("?")[0].rstrip("/")
-            if board_id and len(board_id) < 80:
-                return ats_type, board_id
-    for pattern, ats_type, group in SMARTRECRUITERS_PATTERNS:
-        m = pattern.search(text)
-        if m:
-            board_id = m.group(group).strip("'\"").split("?")[0].rstrip("/")
-            if board_id and len(board_id) < 80:
-                return ats_type, board_id
-    wd = _detect_workday(text)
-    if wd is not None:
-        return wd
-    jz = _detect_jazzhr(text)
-    if jz is not None:
-        return jz
-    wk = _detect_workable(text)
-    if wk is not None:
-        return wk
-    rc = _detect_recruitee(text)
-    if rc is not None:
-        return rc
-    ic = _detect_icims(text)
-    if ic is not None:
-        return ic
-    return "generic", None
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _HTML_CACHE_LOCK:
+        if key in _HTML_CACHE:
+            _HTML_CACHE.move_to_end(key)
+            return _HTML_CACHE[key]
+    result = _scan_html(text)
+    with _HTML_CACHE_LOCK:
+        _HTML_CACHE[key] = result
+        if len(_HTML_CACHE) > HTML_CACHE_SIZE:
+            _HTML_CACHE.popitem(last=False)
+    return result
+
+
+def _scan_html(text: str) -> Result:
+    present = _markers_present(text.lower())
+    if not present:
+        return "generic", None
+    for ats_type, raw in _iter_pattern_matches(text, present):
+        board_id = raw.strip("'\"").split("?")[0].rstrip("/")
+        if board_id and len(board_id) < 80:
+            return ats_type, board_id
+    found = _detect_hosts(text, present)
+    return found if found is not None else ("generic", None)
 
 
+@lru_cache(maxsize=2048)
 def detect_ats(careers_url: str) -> Result:
     """
     Given a career page URL, return (ats_type, board_id).
@@ -168,40 +222,9 @@ def detect_ats(careers_url: str) -> Result:
     path = (parsed.path or "").strip("/")
     full_url = url.lower()
 
-    for pattern, ats_type, group in GREENHOUSE_PATTERNS:
-        m = pattern.search(full_url)
-        if m:
-            return ats_type, m.group(group)
-
-    for pattern, ats_type, group in LEVER_PATTERNS:
-        m = pattern.search(full_url)
-        if m:
-            return ats_type, m.group(group)
-
-    for pattern, ats_type, group in ASHBY_PATTERNS:
-        m = pattern.search(full_url)
-        if m:
-            return ats_type, m.group(group)
+    present = _markers_present(full_url)
+    for ats_type, board_id in _iter_pattern_matches(full_url, present):
+        return ats_type, board_id
 
-    for pattern, ats_type, group in SMARTRECRUITERS_PATTERNS:
-        m = pattern.search(full_url)
-        if m:
-            return ats_type, m.group(group)
-
-    wd = _detect_workday(full_url)
-    if wd is not None:
-        return wd
-    jz = _detect_jazzhr(full_url)
-    if jz is not None:
-        return jz
-    wk = _detect_workable(full_url)
-    if wk is not None:
-        return wk
-    rc = _detect_recruitee(full_url)
-    if rc is not None:
-        return rc
-    ic = _detect_icims(full_url)
-    if ic is not None:
-        return ic
-
-    return "generic", None
+    found = _detect_hosts(full_url, present)
+    return found if found is not None else ("generic", None)
@@ -7,7 +7,7 @@ Strategy, in order:
 2. Fall back to an anchor-link heuristic with a few site-specific cases
    (Google ``/about/careers/applications/jobs/results/``, JazzHR ``/apply/``).
 
-Returns a list of normalized job dicts. May still be empty or partial for
+Returns a list of normalized Job records. May still be empty or partial for
 heavy SPAs.
 """
 
@@ -15,25 +15,25 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 from typing import Any, Iterable
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from src.ats._http import SESSION
+from src.ats.job import Job
 
 TIMEOUT = 15
 
-JobDict = dict[str, Any]
+# One alternation over the lowercased "<path> <link text>"; the keyword branches have no
+# spaces, so nothing matches across the join. The last branch covers JazzHR / Resumator
+# boards on *.applytojob.com (job links look like /apply/{id}/{slug}).
+LINK_UNION = re.compile(r"job|position|role|career|opening|/apply/[a-z0-9]+/")
 
-LINK_PATTERNS = [
-    re.compile(r"job", re.I),
-    re.compile(r"position", re.I),
-    re.compile(r"role", re.I),
-    re.compile(r"career", re.I),
-    re.compile(r"opening", re.I),
-    # JazzHR / Resumator boards on *.applytojob.com (job links look like /apply/{id}/{slug})
-    re.compile(r"/apply/[A-Za-z0-9]+/"),
-]
+# Aggregator links are never a company's own postings.
+_BLOCKED_HOSTS = ("linkedin.com", "indeed.com", "glassdoor")
 
 
 def _looks_like_google_job(parsed_url) -> bool:
@@ -92,10 +92,10 @@ def _location_from_jobposting(entry: dict) -> str | None:
     return " | ".join(deduped) or None
 
 
-def _iter_jsonld_blocks(soup: BeautifulSoup) -> Iterable[Any]:
+def _iter_jsonld_blocks(tree: LexborHTMLParser) -> Iterable[Any]:
     """Yield every parsed JSON-LD block (``<script type="application/ld+json">``)."""
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        raw = (script.string or script.get_text() or "").strip()
+    for script in tree.css('script[type="application/ld+json"]'):
+        raw = (script.text() or "").strip()
         if not raw:
             continue
         # Some pages concatenate multiple objects; try loads then fall back.
@@ -124,11 +124,10 @@ def _flatten_jsonld(node: Any) -> Iterable[dict]:
             yield from _flatten_jsonld(item)
 
 
-def _extract_jsonld_jobs(html: str, base_url: str) -> list[JobDict]:
-    soup = BeautifulSoup(html, "html.parser")
-    found: list[JobDict] = []
+def _extract_jsonld_jobs(tree: LexborHTMLParser, base_url: str) -> list[Job]:
+    found: list[Job] = []
     seen_urls: set[str] = set()
-    for block in _iter_jsonld_blocks(soup):
+    for block in _iter_jsonld_blocks(tree):
         for entry in _flatten_jsonld(block):
             t = entry.get("@type")
             if isinstance(t, list):
@@ -154,93 +153,97 @@ def _extract_jsonld_jobs(html: str, base_url: str) -> list[JobDict]:
             hiring = entry.get("hiringOrganization")
             department = None
             if isinstance(entry.get("industry"), str):
-                department = entry["industry"]
-            found.append({
-                "id": (ext_id or url)[:200],
-                "title": str(title)[:200],
-                "location": _location_from_jobposting(entry),
-                "department": department,
-                "url": url,
-                "posted_at": entry.get("datePosted"),
-                "description": entry.get("description") if isinstance(entry.get("description"), str) else None,
-            })
+                department = sys.intern(entry["industry"])
+            location = _location_from_jobposting(entry)
+            found.append(Job(
+                id=(ext_id or url)[:200],
+                title=str(title)[:200],
+                location=sys.intern(location) if location else None,
+                department=department,
+                url=url,
+                posted_at=entry.get("datePosted"),
+                description=entry.get("description") if isinstance(entry.get("description"), str) else None,
+            ))
     return found
 
 
-def _extract_link_jobs(html: str, base_url: str) -> list[JobDict]:
-    soup = BeautifulSoup(html, "html.parser")
+def _find_time(a: LexborNode) -> LexborNode | None:
+    """Nearest ``<time>`` inside the anchor, else inside its parent."""
+    time_el = a.css_first("time")
+    if time_el is None and a.parent is not None:
+        time_el = a.parent.css_first("time")
+    return time_el
+
+
+def _extract_link_jobs(tree: LexborHTMLParser, base_url: str) -> list[Job]:
     base_host = (urlparse(base_url).netloc or "").lower()
     is_google_results_board = (
         "google.com" in base_host
         and "/about/careers/applications/jobs/results" in (urlparse(base_url).path or "").lower()
     )
     seen: set[str] = set()
-    out: list[JobDict] = []
-    for a in soup.find_all("a", href=True):
-        href = a.get("href", "").strip()
+    out: list[Job] = []
+    for a in tree.css("a[href]"):
+        href = (a.attributes.get("href") or "").strip()
         if not href or href.startswith("#") or href in seen:
             continue
         if is_google_results_board and href.startswith("jobs/results/"):
             full_url = urljoin("https://www.google.com/about/careers/applications/", href)
         else:
             full_url = urljoin(base_url, href)
-        text = (a.get_text() or "").strip()
-        parsed = urlparse(full_url)
-        path_norm = parsed.path.rstrip("/").lower()
-        if "applytojob.com" in (parsed.netloc or "").lower() and path_norm in ("/apply", ""):
+        if any(b in full_url for b in _BLOCKED_HOSTS):
             continue
+        text = (a.text() or "").strip()
+        parsed = urlparse(full_url)
         path_lower = parsed.path.lower()
-        text_lower = text.lower()
+        if "applytojob.com" in (parsed.netloc or "").lower() and path_lower.rstrip("/") in ("/apply", ""):
+            continue
         google_job_link = _looks_like_google_job(parsed)
-        if is_google_results_board and not google_job_link:
+        if google_job_link:
+            if len(text) < 3:
+                tail = path_lower.split("/jobs/results/", 1)[1]
+                slug = tail.split("-", 1)[1] if "-" in tail else tail
+                text = slug.replace("-", " ").strip().title()[:200]
+        elif is_google_results_board:
             continue
-        if not google_job_link and not any(p.search(path_lower) or p.search(text_lower) for p in LINK_PATTERNS):
+        # Cheap length gate before the regex; Google titles are settled above.
+        if len(text) < 3 or len(text) > 200:
             continue
-        if "linkedin.com" in full_url or "indeed.com" in full_url or "glassdoor" in full_url:
+        if not google_job_link and not LINK_UNION.search(f"{path_lower} {text.lower()}"):
             continue
         if "info.jazzhr.com" in full_url.lower() or "job-seekers" in path_lower:
             continue
-        if google_job_link and len(text) < 3:
-            tail = parsed.path.lower().split("/jobs/results/", 1)[1]
-            slug = tail.split("-", 1)[1] if "-" in tail else tail
-            text = slug.replace("-", " ").strip().title()[:200]
         # Try to pull posted_at from a nearby <time datetime=...> element
         posted_at = None
-        time_el = a.find("time") if hasattr(a, "find") else None
-        if time_el is None and hasattr(a, "parent") and a.parent is not None:
-            time_el = a.parent.find("time")
-        if time_el is not None and time_el.get("datetime"):
-            posted_at = time_el.get("datetime")
-        if len(text) < 3 or len(text) > 200:
-            continue
+        time_el = _find_time(a)
+        if time_el is not None and time_el.attributes.get("datetime"):
+            posted_at = time_el.attributes.get("datetime")
         seen.add(href)
         external_id = full_url.split("?")[0].rstrip("/") or full_url
-        out.append({
-            "id": external_id,
-            "title": text or None,
-            "location": None,
-            "department": None,
-            "url": full_url,
-            "posted_at": posted_at,
-            "description": None,
-        })
+        out.append(Job(
+            id=external_id,
+            title=text or None,
+            location=None,
+            department=None,
+            url=full_url,
+            posted_at=posted_at,
+            description=None,
+        ))
     return out
 
 
-def fetch_jobs(careers_url: str) -> list[JobDict]:
+def fetch_jobs(careers_url: str) -> list[Job]:
     """Best-effort scrape: JSON-LD first, then anchor heuristics."""
     try:
-        r = requests.get(
-            careers_url,
-            timeout=TIMEOUT,
-            headers={"User-Agent": "GoldGemJobs/1.0"},
-        )
+        r = SESSION.get(careers_url, timeout=TIMEOUT)
         r.raise_for_status()
         html = r.text
     except requests.RequestException:
         return []
 
-    jsonld_jobs = _extract_jsonld_jobs(html, careers_url)
+    # One lexbor parse serves both passes.
+    tree = LexborHTMLParser(html)
+    jsonld_jobs = _extract_jsonld_jobs(tree, careers_url)
     if jsonld_jobs:
         return jsonld_jobs
-    return _extract_link_jobs(html, careers_url)
+    return _extract_link_jobs(tree, careers_url)
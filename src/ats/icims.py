@@ -13,17 +13,17 @@ iCIMS is a hosted ATS where each tenant runs at a custom subdomain like
 from __future__ import annotations
 
 import re
-from typing import Any
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+from src.ats._http import SESSION
+from src.ats.job import Job
 
 TIMEOUT = 20
 MAX_PAGES = 25  # cap pages traversed (~ several hundred jobs)
 
-JobDict = dict[str, Any]
-
 _JOB_PATH_RE = re.compile(r"/jobs/(\d+)/", re.I)
 
 
@@ -39,24 +39,23 @@ def _resolve_base(board_id: str) -> str:
     return f"https://careers-{s}.icims.com"
 
 
-def fetch_jobs(board_id: str) -> list[JobDict]:
+def fetch_jobs(board_id: str) -> list[Job]:
     base = _resolve_base(board_id)
     if not base:
         return []
     headers = {"User-Agent": "Mozilla/5.0 GoldGemJobs/1.0"}
-    out: list[JobDict] = []
+    out: list[Job] = []
     seen_ids: set[str] = set()
     for page in range(1, MAX_PAGES + 1):
         url = f"{base}/jobs/search?ss=1&pr={page}"
         try:
-            r = requests.get(url, timeout=TIMEOUT, headers=headers, allow_redirects=True)
+            r = SESSION.get(url, timeout=TIMEOUT, headers=headers, allow_redirects=True)
             r.raise_for_status()
         except requests.RequestException:
             break
-        soup = BeautifulSoup(r.text, "html.parser")
         page_count_before = len(seen_ids)
-        for a in soup.find_all("a", href=True):
-            href = a.get("href", "")
+        for a in LexborHTMLParser(r.text).css("a[href]"):
+            href = a.attributes.get("href") or ""
             m = _JOB_PATH_RE.search(href)
             if not m:
                 continue
@@ -64,19 +63,19 @@ def fetch_jobs(board_id: str) -> list[JobDict]:
             if job_id in seen_ids:
                 continue
             full_url = urljoin(base + "/", href)
-            title = (a.get_text() or "").strip()
+            title = (a.text() or "").strip()
             if not title or len(title) < 3:
                 continue
             seen_ids.add(job_id)
-            out.append({
-                "id": job_id,
-                "title": title[:200],
-                "location": None,
-                "department": None,
-                "url": full_url,
-                "posted_at": None,
-                "description": None,
-            })
+            out.append(Job(
+                id=job_id,
+                title=title[:200],
+                location=None,
+                department=None,
+                url=full_url,
+                posted_at=None,
+                description=None,
+            ))
         if len(seen_ids) == page_count_before:
             break  # page returned no new jobs => stop paging.
     return out
@@ -0,0 +1,34 @@
+"""Normalized job record emitted by every ATS fetcher."""
+
+from typing import Any, NamedTuple
+
+from src.filters import _dict_loc
+
+
+class Job(NamedTuple):
+    """One posting: id, title, location, department, url, posted_at (+ JD text when the API has it)."""
+
+    id: str | None
+    title: str | None
+    location: str | None
+    department: str | None
+    url: str | None
+    posted_at: str | None
+    description: str | None = None
+
+
+def add_location(loc_map: dict[str, str], value: Any) -> None:
+    """Record a location under its lowercased form; the first spelling seen wins."""
+    if value is None:
+        return
+    s = str(value).strip()
+    if s:
+        loc_map.setdefault(s.lower(), s)
+
+
+def add_locations_from_list(loc_map: dict[str, str], items: list) -> None:
+    for x in items:
+        if type(x) is dict:
+            add_location(loc_map, _dict_loc(x))
+        else:
+            add_location(loc_map, x)
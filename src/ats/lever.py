@@ -1,66 +1,55 @@
 """Fetch jobs from Lever Postings API (public JSON)."""
 
+import orjson
 import requests
-from typing import Any
+import sys
 
-TIMEOUT = 15
+from src.ats._http import get_parsed
+from src.ats.job import Job, add_locations_from_list
 
-JobDict = dict[str, Any]
+TIMEOUT = 15
 
 
-def fetch_jobs(company_slug: str) -> list[JobDict]:
+def fetch_jobs(company_slug: str) -> list[Job]:
     """
     Fetch all postings for a Lever company.
     GET https://api.lever.co/v0/postings/<company>?mode=json
     """
     url = f"https://api.lever.co/v0/postings/{company_slug}?mode=json"
     try:
-        r = requests.get(url, timeout=TIMEOUT)
-        r.raise_for_status()
-        data = r.json()
-    except (requests.RequestException, ValueError) as e:
+        return list(get_parsed(url, _parse_postings, timeout=TIMEOUT))
+    except (requests.RequestException, ValueError):
         return []
+
+
+def _parse_postings(content: bytes) -> list[Job]:
+    data = orjson.loads(content)
     if not isinstance(data, list):
         return []
-    out: list[JobDict] = []
+    out: list[Job] = []
     for j in data:
         cats = j.get("categories") or {}
         if isinstance(cats, dict):
             location = cats.get("location")
             # Multi-location postings: location can be list of str or list of dicts
-            if isinstance(location, list):
-                parts = []
-                for x in location:
-                    if isinstance(x, dict):
-                        p = x.get("name") or x.get("location") or x.get("value")
-                        if p is not None and str(p).strip():
-                            parts.append(str(p).strip())
-                    elif x is not None and str(x).strip():
-                        parts.append(str(x).strip())
-                # Dedupe by normalized form (first occurrence wins)
-                seen_lev: set[str] = set()
-                unique = []
-                for p in parts:
-                    if not p:
-                        continue
-                    k = p.lower().strip()
-                    if k not in seen_lev:
-                        seen_lev.add(k)
-                        unique.append(p)
-                location = " | ".join(unique) if unique else None
+            if type(location) is list:
+                # Keyed by normalized form, so the first spelling of each location wins
+                loc_map: dict[str, str] = {}
+                add_locations_from_list(loc_map, location)
+                location = " | ".join(loc_map.values()) or None
             department = cats.get("department")
         else:
             location = department = None
         url = j.get("hostedUrl") or j.get("applyUrl")
         raw_id = j.get("id")
         description = j.get("description") if isinstance(j.get("description"), str) else None
-        out.append({
-            "id": str(raw_id) if raw_id is not None else url,
-            "title": j.get("text"),
-            "location": location,
-            "department": department,
-            "url": url,
-            "posted_at": j.get("createdAt"),
-            "description": description,
-        })
+        out.append(Job(
+            id=str(raw_id) if raw_id is not None else url,
+            title=j.get("text"),
+            location=sys.intern(location) if isinstance(location, str) else location,
+            department=sys.intern(department) if isinstance(department, str) else department,
+            url=url,
+            posted_at=j.get("createdAt"),
+            description=description,
+        ))
     return out
@@ -10,9 +10,10 @@ from typing import Any
 
 import requests
 
-TIMEOUT = 20
+from src.ats._http import SESSION
+from src.ats.job import Job
 
-JobDict = dict[str, Any]
+TIMEOUT = 20
 
 
 def _location_string(o: dict[str, Any]) -> str | None:
@@ -26,13 +27,13 @@ def _location_string(o: dict[str, Any]) -> str | None:
     return ", ".join(parts)
 
 
-def fetch_jobs(slug: str) -> list[JobDict]:
+def fetch_jobs(slug: str) -> list[Job]:
     s = (slug or "").strip().strip("/")
     if not s:
         return []
     url = f"https://{s}.recruitee.com/api/offers/"
     try:
-        r = requests.get(url, timeout=TIMEOUT, headers={"User-Agent": "GoldGemJobs/1.0", "Accept": "application/json"})
+        r = SESSION.get(url, timeout=TIMEOUT, headers={"Accept": "application/json"})
         r.raise_for_status()
         data = r.json()
     except (requests.RequestException, ValueError):
@@ -40,7 +41,7 @@ def fetch_jobs(slug: str) -> list[JobDict]:
     offers = data.get("offers") if isinstance(data, dict) else None
     if not isinstance(offers, list):
         return []
-    out: list[JobDict] = []
+    out: list[Job] = []
     for o in offers:
         if not isinstance(o, dict):
             continue
@@ -61,13 +62,13 @@ def fetch_jobs(slug: str) -> list[JobDict]:
             department = d.get("name") or d.get("title")
         elif isinstance(d, str):
             department = d
-        out.append({
-            "id": external_id,
-            "title": title,
-            "location": _location_string(o),
-            "department": department,
-            "url": url_apply,
-            "posted_at": o.get("published_at") or o.get("created_at"),
-            "description": o.get("description") if isinstance(o.get("description"), str) else None,
-        })
+        out.append(Job(
+            id=external_id,
+            title=title,
+            location=_location_string(o),
+            department=department,
+            url=url_apply,
+            posted_at=o.get("published_at") or o.get("created_at"),
+            description=o.get("description") if isinstance(o.get("description"), str) else None,
+        ))
     return out
@@ -6,21 +6,16 @@ from typing import Any
 
 import requests
 
+from src.ats._http import SESSION
 from src.ats.detector import detect_ats, detect_ats_from_html
 from src.ats.greenhouse import discover_board
 
 REQUEST_TIMEOUT = 10
-_HEADERS = {"User-Agent": "GoldGemJobs/1.0"}
 
 
 def _resolve_redirect(url: str) -> str:
     try:
-        r = requests.get(
-            url,
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True,
-            headers=_HEADERS,
-        )
+        r = SESSION.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
         return r.url
     except requests.RequestException:
         return url
@@ -43,11 +38,7 @@ def resolve_ats_for_entry(entry: dict[str, Any]) -> tuple[str | None, str | None
             ats_type, board_id = detect_ats(careers_url)
         if ats_type == "generic" or not board_id:
             try:
-                r = requests.get(
-                    careers_url,
-                    timeout=REQUEST_TIMEOUT,
-                    headers=_HEADERS,
-                )
+                r = SESSION.get(careers_url, timeout=REQUEST_TIMEOUT)
                 if r.ok:
                     discovered_type, discovered_id = detect_ats_from_html(r.text)
                     if discovered_id:
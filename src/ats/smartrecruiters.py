@@ -6,12 +6,13 @@ from typing import Any
 
 import requests
 
+from src.ats._http import SESSION
+from src.ats.job import Job
+
 TIMEOUT = 20
 PAGE_LIMIT = 100
 MAX_PAGES = 30  # cap at 3000 jobs; typical corporate boards are far smaller
 
-JobDict = dict[str, Any]
-
 
 def _location_string(loc: Any) -> str | None:
     if not isinstance(loc, dict):
@@ -24,12 +25,12 @@ def _location_string(loc: Any) -> str | None:
     return ", ".join(parts) if parts else None
 
 
-def fetch_jobs(company_slug: str) -> list[JobDict]:
+def fetch_jobs(company_slug: str) -> list[Job]:
     """Page through `api.smartrecruiters.com/v1/companies/<slug>/postings`."""
     slug = (company_slug or "").strip().strip("/")
     if not slug:
         return []
-    out: list[JobDict] = []
+    out: list[Job] = []
     seen: set[str] = set()
     offset = 0
     for _ in range(MAX_PAGES):
@@ -38,7 +39,7 @@ def fetch_jobs(company_slug: str) -> list[JobDict]:
             f"?limit={PAGE_LIMIT}&offset={offset}"
         )
         try:
-            r = requests.get(url, timeout=TIMEOUT, headers={"User-Agent": "GoldGemJobs/1.0"})
+            r = SESSION.get(url, timeout=TIMEOUT)
             r.raise_for_status()
             data = r.json()
         except (requests.RequestException, ValueError):
@@ -64,15 +65,15 @@ def fetch_jobs(company_slug: str) -> list[JobDict]:
             elif isinstance(d, str):
                 dept = d
             posted_at = j.get("releasedDate") or j.get("createdOn") or j.get("postingDate")
-            out.append({
-                "id": posting_id,
-                "title": title,
-                "location": _location_string(j.get("location")),
-                "department": dept,
-                "url": apply_url or ref,
-                "posted_at": posted_at,
-                "description": None,
-            })
+            out.append(Job(
+                id=posting_id,
+                title=title,
+                location=_location_string(j.get("location")),
+                department=dept,
+                url=apply_url or ref,
+                posted_at=posted_at,
+                description=None,
+            ))
         total = data.get("totalFound") or 0
         offset += PAGE_LIMIT
         if offset >= total:
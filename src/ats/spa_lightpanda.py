@@ -10,13 +10,12 @@ Set in watchlist:
 """
 
 import os
-from typing import Any
+
+from src.ats.job import Job
 
 CDP_URL = os.getenv("LIGHTPANDA_CDP_URL", "http://127.0.0.1:9222")
 PAGE_TIMEOUT_MS = 45_000
 
-JobDict = dict[str, Any]
-
 
 def _extract_jobs_js() -> str:
     """Return JS to run in page context. Extracts job links (Workday-style /job/ID/Title, RBC, etc.)."""
@@ -45,7 +44,7 @@ def _extract_jobs_js() -> str:
     """
 
 
-def fetch_jobs(job_board_url: str) -> list[JobDict]:
+def fetch_jobs(job_board_url: str) -> list[Job]:
     """
     Use Lightpanda (CDP) to load the job board, let JS render, then extract job links.
     Falls back to empty list if Lightpanda is unavailable.
@@ -87,7 +86,7 @@ def fetch_jobs(job_board_url: str) -> list[JobDict]:
             except Exception:
                 pass
 
-    out: list[JobDict] = []
+    out: list[Job] = []
     seen_urls: set[str] = set()
     for item in raw or []:
         u = (item.get("url") or "").strip()
@@ -102,12 +101,12 @@ def fetch_jobs(job_board_url: str) -> list[JobDict]:
             t = (t or "")[:200]
         seen_urls.add(u)
         ext_id = u.split("?")[0].rstrip("/") or u
-        out.append({
-            "id": ext_id,
-            "title": t or None,
-            "location": None,
-            "department": None,
-            "url": u,
-            "posted_at": None,
-        })
+        out.append(Job(
+            id=ext_id,
+            title=t or None,
+            location=None,
+            department=None,
+            url=u,
+            posted_at=None,
+        ))
     return out
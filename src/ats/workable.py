@@ -9,19 +9,17 @@ to the generic HTML scraper. ``board_id`` here is just the Workable slug
 
 from __future__ import annotations
 
-from typing import Any
 
 from src.ats.generic import fetch_jobs as generic_fetch
+from src.ats.job import Job
 from src.ats.spa_lightpanda import fetch_jobs as spa_fetch
 
-JobDict = dict[str, Any]
-
 
 def _board_url(slug: str) -> str:
     return f"https://apply.workable.com/{slug.strip('/')}/"
 
 
-def fetch_jobs(slug: str) -> list[JobDict]:
+def fetch_jobs(slug: str) -> list[Job]:
     s = (slug or "").strip().strip("/")
     if not s:
         return []
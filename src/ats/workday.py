@@ -8,16 +8,16 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Any
 
 import requests
 
+from src.ats._http import SESSION
+from src.ats.job import Job
+
 TIMEOUT = 20
 PAGE_LIMIT = 20  # Workday caps at 20 per request
 MAX_PAGES = 50   # hard safety cap -> up to 1000 jobs
 
-JobDict = dict[str, Any]
-
 _RELATIVE_DAYS_RE = re.compile(r"(\d+)\s+day", re.I)
 _POSTED_TODAY_RE = re.compile(r"posted\s+today", re.I)
 _POSTED_YESTERDAY_RE = re.compile(r"yesterday", re.I)
@@ -61,7 +61,7 @@ def _relative_to_iso(posted_on: str | None) -> str | None:
     return None
 
 
-def fetch_jobs(board_id: str) -> list[JobDict]:
+def fetch_jobs(board_id: str) -> list[Job]:
     """Page through Workday CXS search endpoint and normalize results."""
     parts = _parse_board_id(board_id)
     if parts is None:
@@ -74,10 +74,9 @@ def fetch_jobs(board_id: str) -> list[JobDict]:
     headers = {
         "Content-Type": "application/json",
         "Accept": "application/json",
-        "User-Agent": "GoldGemJobs/1.0",
     }
 
-    out: list[JobDict] = []
+    out: list[Job] = []
     seen_ids: set[str] = set()
     offset = 0
     for _ in range(MAX_PAGES):
@@ -88,7 +87,7 @@ def fetch_jobs(board_id: str) -> list[JobDict]:
             "searchText": "",
         }
         try:
-            r = requests.post(endpoint, json=payload, headers=headers, timeout=TIMEOUT)
+            r = SESSION.post(endpoint, json=payload, headers=headers, timeout=TIMEOUT)
             r.raise_for_status()
             data = r.json()
         except (requests.RequestException, ValueError):
@@ -106,15 +105,15 @@ def fetch_jobs(board_id: str) -> list[JobDict]:
             seen_ids.add(ext_id)
             url = f"{job_url_base}{ext}" if ext.startswith("/") else f"{job_url_base}/{ext}"
             posted_at = _relative_to_iso(j.get("postedOn"))
-            out.append({
-                "id": ext_id,
-                "title": j.get("title"),
-                "location": j.get("locationsText"),
-                "department": None,
-                "url": url,
-                "posted_at": posted_at,
-                "description": None,
-            })
+            out.append(Job(
+                id=ext_id,
+                title=j.get("title"),
+                location=j.get("locationsText"),
+                department=None,
+                url=url,
+                posted_at=posted_at,
+                description=None,
+            ))
         offset += PAGE_LIMIT
         # Some Workday instances return total only on the first page; stop when a page is short.
         if len(postings) < PAGE_LIMIT:
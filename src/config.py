@@ -21,6 +21,8 @@ DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
 # Optional second webhook for Tier B (core match but failed JD or recency — review queue)
 DISCORD_REVIEW_WEBHOOK_URL = os.getenv("DISCORD_REVIEW_WEBHOOK_URL", "")
 SCRAPE_INTERVAL_MINUTES = int(os.getenv("SCRAPE_INTERVAL_MINUTES", "15"))
+# Reuse an auto-detected ATS/board for this many days before probing the careers page again
+ATS_REDETECT_DAYS = int(os.getenv("ATS_REDETECT_DAYS", "7"))
 
 
 def _read_watchlist_yaml() -> dict:
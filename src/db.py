@@ -1,9 +1,12 @@
 """SQLite schema, upsert jobs, query new since last run."""
 
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from src.config import DB_PATH
 
@@ -12,148 +15,281 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _DB_PATH = DB_PATH if DB_PATH.is_absolute() else _PROJECT_ROOT / DB_PATH
 
 
+# WAL lets readers (track.py, digests) run while a scrape writes; synchronous=NORMAL only
+# fsyncs at checkpoints, which WAL keeps durable across application crashes.
+_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA busy_timeout=5000;
+"""
+
+# Prepared statements kept per connection (sqlite3's default is 128). Each distinct SQL string
+# is one entry, and get_jobs_for_companies builds one per IN-list length and term count.
+_CACHED_STATEMENTS = 256
+
+_CONN: sqlite3.Connection | None = None
+_CONN_LOCK = threading.Lock()
+
+
 def _conn() -> sqlite3.Connection:
-    _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """
+    The process-wide connection, opened on first use. It runs in autocommit mode: each
+    statement commits on its own unless it is inside transaction(). The connection is
+    closed at exit so SQLite checkpoints the WAL back into jobs.db before CI copies it.
+    """
+    global _CONN
+    if _CONN is None:
+        with _CONN_LOCK:
+            if _CONN is None:
+                _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    _DB_PATH,
+                    isolation_level=None,
+                    check_same_thread=False,
+                    cached_statements=_CACHED_STATEMENTS,
+                )
+                conn.row_factory = sqlite3.Row
+                conn.executescript(_PRAGMAS)
+                atexit.register(conn.close)
+                _CONN = conn
+    return _CONN
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Run the block's writes in one BEGIN IMMEDIATE ... COMMIT (a single commit instead of one
+    per statement); roll back if it raises. Nested blocks join the outermost transaction.
+    """
+    c = _conn()
+    if c.in_transaction:
+        yield c
+        return
+    c.execute("BEGIN IMMEDIATE")
+    try:
+        yield c
+    except BaseException:
+        c.execute("ROLLBACK")
+        raise
+    c.execute("COMMIT")
 
 
 def init_db() -> None:
     """Create tables if they don't exist."""
     _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with _conn() as c:
-        c.executescript("""
-            CREATE TABLE IF NOT EXISTS companies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                careers_url TEXT NOT NULL,
-                ats_type TEXT,
-                board_id TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            );
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_companies_careers_url
-                ON companies(careers_url);
-
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company_id INTEGER NOT NULL REFERENCES companies(id),
-                external_id TEXT NOT NULL,
-                title TEXT,
-                location TEXT,
-                department TEXT,
-                url TEXT,
-                posted_at TEXT,
-                first_seen_at TEXT NOT NULL,
-                last_seen_at TEXT NOT NULL
-            );
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_company_external
-                ON jobs(company_id, external_id);
-
-            CREATE TABLE IF NOT EXISTS runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                started_at TEXT NOT NULL,
-                finished_at TEXT,
-                companies_checked INTEGER DEFAULT 0,
-                new_jobs_count INTEGER DEFAULT 0
-            );
-        """)
-        # Migration: add columns added in later versions to existing DBs.
-        try:
-            info = c.execute("PRAGMA table_info(jobs)").fetchall()
-            columns = [row[1] for row in info]
-            if "posted_at" not in columns:
-                c.execute("ALTER TABLE jobs ADD COLUMN posted_at TEXT")
-            if "description" not in columns:
-                c.execute("ALTER TABLE jobs ADD COLUMN description TEXT")
-            if "applied_at" not in columns:
-                c.execute("ALTER TABLE jobs ADD COLUMN applied_at TEXT")
-            if "dismissed_at" not in columns:
-                c.execute("ALTER TABLE jobs ADD COLUMN dismissed_at TEXT")
-            if "notes" not in columns:
-                c.execute("ALTER TABLE jobs ADD COLUMN notes TEXT")
-        except sqlite3.OperationalError:
-            pass
-
-        # Cross-run dedupe: stable (company, normalized_title) keys we've already alerted.
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS notified_keys (
-                key TEXT PRIMARY KEY,
-                first_notified_at TEXT NOT NULL
-            )
-            """
+    c = _conn()
+    c.executescript("""
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            careers_url TEXT NOT NULL,
+            ats_type TEXT,
+            board_id TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            detected_at TEXT
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_companies_careers_url
+            ON companies(careers_url);
+
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL REFERENCES companies(id),
+            external_id TEXT NOT NULL,
+            title TEXT,
+            location TEXT,
+            department TEXT,
+            url TEXT,
+            posted_at TEXT,
+            first_seen_at TEXT NOT NULL,
+            last_seen_at TEXT NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_company_external
+            ON jobs(company_id, external_id);
+        -- get_new_jobs_since: range scan + ORDER BY without a full scan and sort.
+        CREATE INDEX IF NOT EXISTS idx_jobs_first_seen
+            ON jobs(first_seen_at DESC);
+
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            finished_at TEXT,
+            companies_checked INTEGER DEFAULT 0,
+            new_jobs_count INTEGER DEFAULT 0
+        );
+    """)
+    # Migration: add columns added in later versions to existing DBs.
+    try:
+        info = c.execute("PRAGMA table_info(jobs)").fetchall()
+        columns = [row[1] for row in info]
+        if "posted_at" not in columns:
+            c.execute("ALTER TABLE jobs ADD COLUMN posted_at TEXT")
+        if "description" not in columns:
+            c.execute("ALTER TABLE jobs ADD COLUMN description TEXT")
+        if "applied_at" not in columns:
+            c.execute("ALTER TABLE jobs ADD COLUMN applied_at TEXT")
+        if "dismissed_at" not in columns:
+            c.execute("ALTER TABLE jobs ADD COLUMN dismissed_at TEXT")
+        if "notes" not in columns:
+            c.execute("ALTER TABLE jobs ADD COLUMN notes TEXT")
+    except sqlite3.OperationalError:
+        pass
+    try:
+        columns = [row[1] for row in c.execute("PRAGMA table_info(companies)").fetchall()]
+        if "detected_at" not in columns:
+            c.execute("ALTER TABLE companies ADD COLUMN detected_at TEXT")
+    except sqlite3.OperationalError:
+        pass
+
+    # Cross-run dedupe: stable (company, normalized_title) keys we've already alerted.
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notified_keys (
+            key TEXT PRIMARY KEY,
+            first_notified_at TEXT NOT NULL
         )
+        """
+    )
 
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Per-company/per-job write statements, kept as module constants so each maps to one entry in
+# the connection's prepared-statement cache for the life of the process.
+_SELECT_COMPANY_SQL = "SELECT id, ats_type, board_id FROM companies WHERE careers_url = ?"
+
+_UPSERT_COMPANY_SQL = """
+    INSERT INTO companies (name, careers_url, ats_type, board_id, created_at, updated_at, detected_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(careers_url) DO UPDATE SET
+        name = excluded.name,
+        ats_type = excluded.ats_type,
+        board_id = excluded.board_id,
+        updated_at = excluded.updated_at,
+        detected_at = CASE WHEN ? THEN NULL ELSE COALESCE(excluded.detected_at, companies.detected_at) END
+    RETURNING id
+"""
+
+
 def upsert_company(
     name: str,
     careers_url: str,
     ats_type: str | None = None,
     board_id: str | None = None,
+    detected_at: str | None = None,
+    now: str | None = None,
+    pinned: bool = False,
 ) -> tuple[int, bool]:
-    """Insert or update company; return (company id, ats_config_changed)."""
-    now = _now()
-    with _conn() as c:
-        existing = c.execute(
-            "SELECT id, ats_type, board_id FROM companies WHERE careers_url = ?",
-            (careers_url,),
-        ).fetchone()
+    """
+    Insert or update company; return (company id, ats_config_changed).
+    detected_at: set when ats_type/board_id were just probed from the web (see
+    get_detected_ats); None keeps the stored timestamp.
+    pinned: ats_type/board_id come from the watchlist, not a probe, so any stored detected_at
+    is cleared; otherwise unpinning the entry would reuse the pinned pair as a detection.
+    now: ISO timestamp to stamp the row with; run_once passes one per run (default: current time).
+    """
+    now = now or _now()
+    with transaction() as c:
+        existing = c.execute(_SELECT_COMPANY_SQL, (careers_url,)).fetchone()
         if existing is None:
             ats_changed = bool(ats_type and ats_type != "generic" and board_id)
         else:
             ats_changed = (existing["ats_type"] != ats_type) or (existing["board_id"] != board_id)
-        c.execute(
-            """
-            INSERT INTO companies (name, careers_url, ats_type, board_id, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(careers_url) DO UPDATE SET
-                name = excluded.name,
-                ats_type = excluded.ats_type,
-                board_id = excluded.board_id,
-                updated_at = excluded.updated_at
-            """,
-            (name, careers_url, ats_type, board_id, now, now),
-        )
         row = c.execute(
-            "SELECT id FROM companies WHERE careers_url = ?",
-            (careers_url,),
+            _UPSERT_COMPANY_SQL,
+            (name, careers_url, ats_type, board_id, now, now, detected_at, pinned),
         ).fetchone()
         return row["id"], ats_changed
 
 
+def get_detected_ats(max_age_days: int) -> dict[str, tuple[str, str]]:
+    """
+    careers_url -> (ats_type, board_id) for companies whose ATS was probed within the last
+    max_age_days and resolved to a specific board. Generic results are left out, so those
+    companies are probed again every run.
+    """
+    since = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+    c = _conn()
+    rows = c.execute(
+        """
+        SELECT careers_url, ats_type, board_id FROM companies
+        WHERE detected_at >= ? AND ats_type IS NOT NULL AND ats_type != 'generic'
+            AND board_id IS NOT NULL AND board_id != ''
+        """,
+        (since,),
+    ).fetchall()
+    return {r["careers_url"]: (r["ats_type"], r["board_id"]) for r in rows}
+
+
+def _like_contains(term: str) -> str:
+    """LIKE pattern for "contains term"; spaces become % so \\s+ word-mode matches still hit."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return "%" + escaped.replace(" ", "%") + "%"
+
+
 def get_jobs_for_companies(
     company_ids: list[int],
     *,
     exclude_handled: bool = True,
+    title_dept_terms: list[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """All jobs for the given companies (used after ATS upgrades to backfill alerts)."""
+    """All jobs for the given companies (used after ATS upgrades to backfill alerts).
+
+    title_dept_terms (lowercase, accent-free; see filters.level_prefilter_terms) keeps only rows
+    whose "title department" contains one of them. It is a superset of the Python filter:
+    LIKE only case-folds ASCII, so rows with any non-ASCII title/department always pass.
+    """
     ids = [i for i in company_ids if i]
     if not ids:
         return []
     placeholders = ",".join("?" * len(ids))
     where = f"WHERE j.company_id IN ({placeholders})"
+    params: list[Any] = list(ids)
     if exclude_handled:
         where += " AND j.applied_at IS NULL AND j.dismissed_at IS NULL"
-    with _conn() as c:
-        rows = c.execute(
-            f"""
-            SELECT {_JOB_SELECT_COLUMNS}
-            FROM jobs j
-            JOIN companies c ON c.id = j.company_id
-            {where}
-            ORDER BY j.first_seen_at DESC
-            """,
-            ids,
-        ).fetchall()
+    if title_dept_terms:
+        title_dept = "(COALESCE(j.title, '') || ' ' || COALESCE(j.department, ''))"
+        likes = " OR ".join(f"{title_dept} LIKE ? ESCAPE '\\'" for _ in title_dept_terms)
+        where += (
+            f" AND ({likes}"
+            " OR (COALESCE(j.title, '') || COALESCE(j.department, '')) GLOB '*[^ -~]*')"
+        )
+        params.extend(_like_contains(t) for t in title_dept_terms)
+    c = _conn()
+    rows = c.execute(
+        f"""
+        SELECT {_JOB_SELECT_COLUMNS}
+        FROM jobs j
+        JOIN companies c ON c.id = j.company_id
+        {where}
+        ORDER BY j.first_seen_at DESC
+        """,
+        params,
+    ).fetchall()
     return [dict(r) for r in rows]
 
 
+# A row is new iff the upsert took the INSERT branch: DO UPDATE moves last_seen_at forward
+# but leaves first_seen_at alone.
+_UPSERT_JOB_RETURNING_SQL = """
+    INSERT INTO jobs (company_id, external_id, title, location, department, url, posted_at, description, first_seen_at, last_seen_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(company_id, external_id) DO UPDATE SET
+        title = excluded.title,
+        location = excluded.location,
+        department = excluded.department,
+        url = excluded.url,
+        posted_at = COALESCE(excluded.posted_at, jobs.posted_at),
+        description = excluded.description,
+        last_seen_at = excluded.last_seen_at
+    RETURNING id, first_seen_at = last_seen_at
+"""
+
+
 def upsert_job(
     company_id: int,
     external_id: str,
@@ -163,40 +299,48 @@ def upsert_job(
     url: str | None,
     posted_at: str | None = None,
     description: str | None = None,
+    now: str | None = None,
 ) -> tuple[int, bool]:
     """
     Insert or update job. Return (job_id, is_new).
     is_new is True only when the job was just inserted (first time seen).
     posted_at: optional ISO date from ATS (used for recency filter).
     description: optional full JD text for experience-based filtering.
+    now: ISO timestamp for first/last_seen_at (default: current time).
     """
-    now = _now()
-    with _conn() as c:
-        existing = c.execute(
-            "SELECT id FROM jobs WHERE company_id = ? AND external_id = ?",
-            (company_id, external_id),
-        ).fetchone()
-        is_new = existing is None
-        c.execute(
-            """
-            INSERT INTO jobs (company_id, external_id, title, location, department, url, posted_at, description, first_seen_at, last_seen_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(company_id, external_id) DO UPDATE SET
-                title = excluded.title,
-                location = excluded.location,
-                department = excluded.department,
-                url = excluded.url,
-                posted_at = COALESCE(excluded.posted_at, jobs.posted_at),
-                description = excluded.description,
-                last_seen_at = excluded.last_seen_at
-            """,
-            (company_id, external_id, title, location, department, url, posted_at, description, now, now),
-        )
-        row = c.execute(
-            "SELECT id FROM jobs WHERE company_id = ? AND external_id = ?",
-            (company_id, external_id),
-        ).fetchone()
-        return row["id"], is_new
+    now = now or _now()
+    # A single statement, so autocommit already makes it atomic.
+    job_id, is_new = _conn().execute(
+        _UPSERT_JOB_RETURNING_SQL,
+        (company_id, external_id, title, location, department, url, posted_at, description, now, now),
+    ).fetchone()
+    return job_id, bool(is_new)
+
+
+def upsert_jobs_bulk(
+    company_id: int,
+    rows: list[tuple[str, str | None, str | None, str | None, str | None, str | None, str | None]],
+    now: str | None = None,
+) -> list[tuple[int, bool]]:
+    """
+    Upsert one company's jobs in a single transaction. Return [(job_id, is_new), ...].
+    rows: (external_id, title, location, department, url, posted_at, description) tuples.
+    Rows repeating an external_id collapse to the last one, so each job is counted once;
+    results follow the order in which external_ids first appear.
+    now: ISO timestamp for first/last_seen_at (default: current time).
+    """
+    by_external_id = {r[0]: r for r in rows}
+    now = now or _now()
+    out: list[tuple[int, bool]] = []
+    # executemany() discards RETURNING rows, so run the cached statement once per row.
+    with transaction() as c:
+        for external_id, title, location, department, url, posted_at, description in by_external_id.values():
+            job_id, is_new = c.execute(
+                _UPSERT_JOB_RETURNING_SQL,
+                (company_id, external_id, title, location, department, url, posted_at, description, now, now),
+            ).fetchone()
+            out.append((job_id, bool(is_new)))
+    return out
 
 
 _JOB_SELECT_COLUMNS = (
@@ -207,28 +351,29 @@ _JOB_SELECT_COLUMNS = (
 )
 
 
-def get_new_jobs_since(since: datetime, *, exclude_handled: bool = True) -> list[dict[str, Any]]:
-    """Return jobs where first_seen_at >= since, with company info joined.
+def get_new_jobs_since(since: datetime, *, exclude_handled: bool = True) -> Iterator[dict[str, Any]]:
+    """Yield jobs where first_seen_at >= since, with company info joined.
 
     When exclude_handled is True (default), drop jobs already marked applied or dismissed
     so we never re-notify on rows the user has already processed.
+    Rows are streamed from the cursor one dict at a time; wrap in list() to materialize.
     """
     since_str = since.isoformat()
     where = "WHERE j.first_seen_at >= ?"
     if exclude_handled:
         where += " AND j.applied_at IS NULL AND j.dismissed_at IS NULL"
-    with _conn() as c:
-        rows = c.execute(
-            f"""
-            SELECT {_JOB_SELECT_COLUMNS}
-            FROM jobs j
-            JOIN companies c ON c.id = j.company_id
-            {where}
-            ORDER BY j.first_seen_at DESC
-            """,
-            (since_str,),
-        ).fetchall()
-    return [dict(r) for r in rows]
+    c = _conn()
+    for r in c.execute(
+        f"""
+        SELECT {_JOB_SELECT_COLUMNS}
+        FROM jobs j
+        JOIN companies c ON c.id = j.company_id
+        {where}
+        ORDER BY j.first_seen_at DESC
+        """,
+        (since_str,),
+    ):
+        yield dict(r)
 
 
 def get_jobs_first_seen_within_days(
@@ -242,17 +387,17 @@ def get_jobs_first_seen_within_days(
     where = "WHERE j.first_seen_at >= ?"
     if exclude_handled:
         where += " AND j.applied_at IS NULL AND j.dismissed_at IS NULL"
-    with _conn() as c:
-        rows = c.execute(
-            f"""
-            SELECT {_JOB_SELECT_COLUMNS}
-            FROM jobs j
-            JOIN companies c ON c.id = j.company_id
-            {where}
-            ORDER BY j.first_seen_at DESC
-            """,
-            (since_str,),
-        ).fetchall()
+    c = _conn()
+    rows = c.execute(
+        f"""
+        SELECT {_JOB_SELECT_COLUMNS}
+        FROM jobs j
+        JOIN companies c ON c.id = j.company_id
+        {where}
+        ORDER BY j.first_seen_at DESC
+        """,
+        (since_str,),
+    ).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -267,16 +412,16 @@ def _find_job_id_by_url(url: str) -> int | None:
     if not s:
         return None
     bare = s.split("?", 1)[0].split("#", 1)[0].rstrip("/")
-    with _conn() as c:
-        for query, args in (
-            ("SELECT id FROM jobs WHERE url = ?", (s,)),
-            ("SELECT id FROM jobs WHERE url = ?", (bare,)),
-            ("SELECT id FROM jobs WHERE external_id = ?", (s,)),
-            ("SELECT id FROM jobs WHERE external_id = ?", (bare,)),
-        ):
-            row = c.execute(query, args).fetchone()
-            if row is not None:
-                return int(row["id"])
+    c = _conn()
+    for query, args in (
+        ("SELECT id FROM jobs WHERE url = ?", (s,)),
+        ("SELECT id FROM jobs WHERE url = ?", (bare,)),
+        ("SELECT id FROM jobs WHERE external_id = ?", (s,)),
+        ("SELECT id FROM jobs WHERE external_id = ?", (bare,)),
+    ):
+        row = c.execute(query, args).fetchone()
+        if row is not None:
+            return int(row["id"])
     return None
 
 
@@ -310,16 +455,16 @@ def mark_job(
     if not sets:
         return target
     args.append(target)
-    with _conn() as c:
-        c.execute(f"UPDATE jobs SET {', '.join(sets)} WHERE id = ?", args)
+    c = _conn()
+    c.execute(f"UPDATE jobs SET {', '.join(sets)} WHERE id = ?", args)
     return target
 
 
 def has_notified_key(key: str) -> bool:
     if not key:
         return False
-    with _conn() as c:
-        row = c.execute("SELECT 1 FROM notified_keys WHERE key = ?", (key,)).fetchone()
+    c = _conn()
+    row = c.execute("SELECT 1 FROM notified_keys WHERE key = ?", (key,)).fetchone()
     return row is not None
 
 
@@ -327,7 +472,7 @@ def remember_notified_keys(keys: list[str]) -> None:
     if not keys:
         return
     now = _now()
-    with _conn() as c:
+    with transaction() as c:
         c.executemany(
             "INSERT OR IGNORE INTO notified_keys (key, first_notified_at) VALUES (?, ?)",
             [(k, now) for k in keys if k],
@@ -337,19 +482,37 @@ def remember_notified_keys(keys: list[str]) -> None:
 def start_run() -> int:
     """Record run start; return run id."""
     now = _now()
-    with _conn() as c:
-        c.execute("INSERT INTO runs (started_at) VALUES (?)", (now,))
-        return c.execute("SELECT last_insert_rowid()").fetchone()[0]
+    c = _conn()
+    c.execute("INSERT INTO runs (started_at) VALUES (?)", (now,))
+    return c.execute("SELECT last_insert_rowid()").fetchone()[0]
 
 
 def finish_run(run_id: int, companies_checked: int, new_jobs_count: int) -> None:
     """Update run with finished_at and counts."""
     now = _now()
-    with _conn() as c:
-        c.execute(
-            "UPDATE runs SET finished_at = ?, companies_checked = ?, new_jobs_count = ? WHERE id = ?",
-            (now, companies_checked, new_jobs_count, run_id),
-        )
+    c = _conn()
+    c.execute(
+        "UPDATE runs SET finished_at = ?, companies_checked = ?, new_jobs_count = ? WHERE id = ?",
+        (now, companies_checked, new_jobs_count, run_id),
+    )
+
+
+def get_interrupted_run_start(run_id: int) -> datetime | None:
+    """
+    started_at of the earliest run before run_id that never reached finish_run (it crashed or
+    was killed, possibly before notifying), counting only runs since the last finished one.
+    None when the previous run finished.
+    """
+    c = _conn()
+    row = c.execute(
+        """
+        SELECT MIN(started_at) FROM runs
+        WHERE id < ? AND finished_at IS NULL
+            AND id > COALESCE((SELECT MAX(id) FROM runs WHERE id < ? AND finished_at IS NOT NULL), 0)
+        """,
+        (run_id, run_id),
+    ).fetchone()
+    return datetime.fromisoformat(row[0]) if row[0] else None
 
 
 def run_database_cleanup(cfg: dict) -> dict[str, Any]:
@@ -373,7 +536,7 @@ def run_database_cleanup(cfg: dict) -> dict[str, Any]:
     jobs_days = cfg.get("delete_jobs_last_seen_older_than_days")
     runs_days = cfg.get("delete_runs_older_than_days")
 
-    with _conn() as c:
+    with transaction() as c:
         if isinstance(jobs_days, int) and jobs_days > 0:
             cutoff = (datetime.now(timezone.utc) - timedelta(days=jobs_days)).isoformat()
             cur = c.execute("DELETE FROM jobs WHERE last_seen_at < ?", (cutoff,))
@@ -397,13 +560,8 @@ def run_database_cleanup(cfg: dict) -> dict[str, Any]:
             out["descriptions_cleared"] = cur.rowcount or 0
 
     if cfg.get("vacuum", True):
-        # VACUUM cannot run inside a transaction with pending changes in some cases; use a fresh connection.
-        vac = sqlite3.connect(str(_DB_PATH))
-        try:
-            vac.execute("VACUUM")
-            vac.commit()
-            out["vacuumed"] = True
-        finally:
-            vac.close()
+        # VACUUM can't run inside a transaction; the shared connection is in autocommit here.
+        _conn().execute("VACUUM")
+        out["vacuumed"] = True
 
     return out
@@ -3,9 +3,15 @@
 import json
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Any
+from typing import Any, Callable, Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # optional: _keyword_matcher falls back to a regex alternation
+    ahocorasick = None
 
 # #region agent log
 _DEBUG_LOG_PATH = str(Path(__file__).resolve().parent.parent / ".cursor" / "debug-cad17e.log")
@@ -66,6 +72,21 @@ TITLE_CANADA_RE = re.compile(
 _LOCATION_SPLIT_RE = re.compile(r"[|/;]|,\s+|\s+and\s+|\s+&\s+|\s+or\s+")
 
 
+def _fold(s: str) -> str:
+    t = s.strip().lower()
+    if t.isascii():
+        return t  # nothing to decompose; most titles and locations take this path
+    # NFD and drop combining characters so accents don't block matches
+    nfd = unicodedata.normalize("NFD", t)
+    return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
+
+
+# Titles, departments and locations repeat across jobs and runs, so their folded forms are
+# memoized. JD bodies are long and unique and would only evict them, so they skip the cache.
+_NORMALIZE_CACHE_MAX_LEN = 256
+_fold_cached = lru_cache(maxsize=4096)(_fold)
+
+
 def _normalize(s: str | None | Any) -> str:
     """Normalize for matching: strip, lower, and remove accents (e.g. Montréal -> montreal)."""
     if s is None:
@@ -76,10 +97,18 @@ def _normalize(s: str | None | Any) -> str:
     if s and not isinstance(s, str):
         _debug_log("cad17e", "filters.py:_normalize", "non-str value passed to _normalize", {"type": type(s).__name__, "repr": repr(s)}, "B")
     # #endregion
-    t = (s or "").strip().lower()
-    # NFD and drop combining characters so accents don't block matches
-    nfd = unicodedata.normalize("NFD", t)
-    return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
+    if len(s) > _NORMALIZE_CACHE_MAX_LEN:
+        return _fold(s)
+    return _fold_cached(s)
+
+
+# Keys tried, in order, for a location given as a dict ({"name": ...}, {"location": ...}, ...).
+# The ATS fetchers share these (src.ats.job), so both sides read location objects alike.
+_LOC_KEYS = ("name", "location", "value")
+
+
+def _dict_loc(d: dict) -> Any:
+    return next((d[k] for k in _LOC_KEYS if d.get(k)), "")
 
 
 def _location_to_string(location: Any) -> str:
@@ -89,20 +118,24 @@ def _location_to_string(location: Any) -> str:
     We merge all into one string (pipe-joined) so downstream matchers can split it again
     or treat the whole blob as a single searchable blob.
     """
+    if type(location) is str:
+        return location.strip()  # DB rows always take this path
     if location is None:
         return ""
     if isinstance(location, list):
         parts = []
         for item in location:
             if isinstance(item, dict):
-                parts.append(item.get("name") or item.get("location") or item.get("value") or "")
-            elif item is not None and str(item).strip():
-                parts.append(str(item).strip())
-        return " | ".join(p for p in parts if p)
+                part = _dict_loc(item)
+            elif item is None:
+                continue
+            else:
+                part = item.strip() if type(item) is str else str(item).strip()
+            if part:
+                parts.append(part)
+        return " | ".join(parts)
     if isinstance(location, dict):
-        return (
-            (location.get("name") or location.get("location") or location.get("value")) or ""
-        ).strip()
+        return (_dict_loc(location) or "").strip()
     return (str(location) or "").strip()
 
 
@@ -134,35 +167,77 @@ def _compile_word_pattern(keywords: list[str]) -> re.Pattern | None:
     return re.compile(pat)
 
 
-def _matches_any(text: str, keywords: list[str], *, mode: str = "substring") -> bool:
+@lru_cache(maxsize=256)
+def _keyword_matcher(keywords: tuple[Any, ...], mode: str) -> Callable[[str], bool]:
     """
-    Return True if any keyword appears in ``text``.
-    mode=substring: classic contains match (fast, legacy behavior).
-    mode=word: word-boundary regex match (avoids "lead" matching "leadership").
+    Build (once per keyword list and mode) a predicate over normalized text.
+    word mode: one word-boundary regex. substring mode: an Aho-Corasick automaton, so a job's
+    text is scanned once however many keywords there are (a literal alternation regex without
+    pyahocorasick).
     """
     # #region agent log
     non_str = [(i, type(k).__name__, repr(k)) for i, k in enumerate(keywords) if not isinstance(k, str)]
     if non_str:
-        _debug_log("cad17e", "filters.py:_matches_any", "keywords contained non-str entries", {"indices_and_types": non_str, "total_keywords": len(keywords)}, "A")
+        _debug_log("cad17e", "filters.py:_keyword_matcher", "keywords contained non-str entries", {"indices_and_types": non_str, "total_keywords": len(keywords)}, "A")
     # #endregion
+    if mode == "word":
+        pat = _compile_word_pattern(list(keywords))
+        if pat is None:
+            return lambda t: False
+        search = pat.search
+        return lambda t: search(t) is not None
+    terms = tuple(dict.fromkeys(_normalize(k) for k in keywords))
+    if "" in terms:
+        return lambda t: True  # "" is a substring of everything
+    if ahocorasick is None:
+        # One alternation scanned by the C regex engine instead of a Python-level ``in`` loop.
+        search = re.compile("|".join(map(re.escape, terms))).search
+        return lambda t: search(t) is not None
+    automaton = ahocorasick.Automaton()
+    for k in terms:
+        automaton.add_word(k, k)
+    automaton.make_automaton()
+    return lambda t: next(automaton.iter(t), None) is not None
+
+
+# The default exclude list is fixed, so its matchers are built once at import rather than
+# looked up (hashing the whole keyword tuple) for every job.
+_DEFAULT_EXCLUDE_MATCHERS = {
+    mode: _keyword_matcher(tuple(DEFAULT_EXCLUDE_KEYWORDS), mode) for mode in ("substring", "word")
+}
+
+
+def _matches_any(text: str, keywords: list[str], *, mode: str = "substring") -> bool:
+    """
+    Return True if any keyword appears in ``text``.
+    mode=substring: classic contains match (fast, legacy behavior).
+    mode=word: word-boundary regex match (avoids "lead" matching "leadership").
+    """
     if not keywords:
         return True
-    t = _normalize(text)
-    if mode == "word":
-        pat = _compile_word_pattern(keywords)
-        return bool(pat and pat.search(t))
-    return any(_normalize(k) in t for k in keywords)
+    return _keyword_matcher(tuple(keywords), mode)(_normalize(text))
 
 
 def _contains_any(text: str, keywords: list[str], *, mode: str = "substring") -> bool:
     """True if text contains any keyword. Same ``mode`` semantics as ``_matches_any``."""
     if not keywords:
         return False
-    t = _normalize(text)
-    if mode == "word":
-        pat = _compile_word_pattern(keywords)
-        return bool(pat and pat.search(t))
-    return any(_normalize(k) in t for k in keywords)
+    return _keyword_matcher(tuple(keywords), mode)(_normalize(text))
+
+
+def level_prefilter_terms(level_keywords: list[str], *, entry_level_only: bool = True) -> list[str] | None:
+    """
+    Normalized level keywords for db.get_jobs_for_companies(title_dept_terms=...), or None when
+    the level check can't reject anything (entry_level_only off, or an empty keyword that
+    matches every title). Only the level stage is pushed down: title_keywords can be rescued
+    by synonym groups and exclude_keywords reject rather than select.
+    """
+    if not entry_level_only or not level_keywords:
+        return None
+    terms = [_normalize(k) for k in level_keywords]
+    if not all(terms):
+        return None
+    return terms
 
 
 def _location_matches(
@@ -185,9 +260,9 @@ def _location_matches(
     location_norm = _normalize(location_str)
     if location_norm:
         aliases = accept_aliases if accept_aliases is not None else DEFAULT_LOCATION_ACCEPT_ALIASES
-        for alias in aliases:
-            if alias and _normalize(alias) in location_norm:
-                return True
+        aliases = tuple(a for a in aliases if a)
+        if aliases and _keyword_matcher(aliases, "substring")(location_norm):
+            return True
     chunks = _split_location_parts(location_str) or [location_str]
     for chunk in chunks:
         if _matches_any(chunk, locations, mode="substring"):
@@ -301,26 +376,78 @@ def _jd_asks_senior_experience(
     return False
 
 
+# ATS feeds repeat posted_at values (bulk-posted reqs, date-only fields), and the scheduler
+# re-filters the same rows every run. Results are immutable datetimes, safe to share.
+@lru_cache(maxsize=4096)
 def _parse_posted_at(posted_at: str | None) -> datetime | None:
     """Parse ISO-ish posted_at; return None if missing or invalid."""
-    if not posted_at or not str(posted_at).strip():
+    if not posted_at:
+        return None
+    s = str(posted_at).strip()
+    if not s:
         return None
     try:
-        s = str(posted_at).strip()
         if "T" in s:
-            if s.endswith("Z") or "+" in s or "-" in s[-6:]:
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-            return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
+            # fromisoformat reads any offset itself; "Z" only needs rewriting before Python 3.11.
+            dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+            return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
         return datetime.strptime(s[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc)
     except (ValueError, TypeError):
         return None
 
 
+def _recency_cutoff(max_days_since_posted: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=max_days_since_posted)
+
+
 def _jd_include_professional_phrases(jd_filter_mode: str) -> bool:
     """standard: full JD rules; yoe_and_senior_only: skip 'professional experience' boilerplate patterns."""
     return jd_filter_mode != "yoe_and_senior_only"
 
 
+def _title_stage_failure(
+    title_dept: str,
+    level_keywords: list[str],
+    title_keywords: list[str],
+    exclude_keywords: list[str] | None,
+    *,
+    entry_level_only: bool,
+    match_mode: str,
+    title_synonym_groups: list[list[str]] | None,
+) -> str | None:
+    """The entry_level, title_keywords and exclude_keywords stages of filter_failure_reason."""
+    if entry_level_only and not _matches_any(title_dept, level_keywords, mode=match_mode):
+        return "entry_level"
+    if not (
+        _matches_any(title_dept, title_keywords, mode=match_mode)
+        or _title_matches_synonyms(title_dept, title_synonym_groups)
+    ):
+        return "title_keywords"
+    if exclude_keywords is None:
+        excluded = _DEFAULT_EXCLUDE_MATCHERS["word" if match_mode == "word" else "substring"](_normalize(title_dept))
+    else:
+        excluded = _contains_any(title_dept, exclude_keywords, mode=match_mode)
+    if excluded:
+        return "exclude_keywords"
+    return None
+
+
+def _posted_before_cutoff(
+    posted_at: str | None,
+    max_days_since_posted: int | None,
+    cutoff: datetime | None,
+) -> bool:
+    """The recency stage: True if posted_at parses and is older than the cutoff."""
+    if max_days_since_posted is None or max_days_since_posted <= 0:
+        return False
+    posted = _parse_posted_at(posted_at)
+    if posted is None:
+        return False
+    if cutoff is None:
+        cutoff = _recency_cutoff(max_days_since_posted)
+    return posted < cutoff
+
+
 def filter_failure_reason(
     job: dict[str, Any],
     locations: list[str],
@@ -339,17 +466,41 @@ def filter_failure_reason(
     allow_title_canada_signal: bool = True,
     newgrad_title_rescue: bool = True,
     max_yoe_accept: int = 3,
+    cutoff: datetime | None = None,
+    fail_fast: bool = False,
 ) -> str | None:
     """
     Return None if the job passes all filters; otherwise the first failing stage name.
     Stages: location, location_field, entry_level, title_keywords, exclude_keywords,
     jd_experience, recency.
+    cutoff: precomputed recency cutoff (now - max_days_since_posted); filter_jobs passes one
+    for the whole batch instead of reading the clock per job.
+    fail_fast: run the cheap stages first; the result is still None exactly when the job passes,
+    but a rejected job may report a later stage than the first failing one above.
     """
     title = _normalize(job.get("title") or "")
     location_str = _location_to_string(job.get("location"))
     department = _normalize(job.get("department") or "")
     title_dept = f"{title} {department}"
 
+    if fail_fast:
+        # Only pass/fail matters, so run the stages that are one matcher call each and reject
+        # most senior postings (title, then the cached posted_at lookup) before the location
+        # split/alias scans and the JD regexes.
+        reason = _title_stage_failure(
+            title_dept,
+            level_keywords,
+            title_keywords,
+            exclude_keywords,
+            entry_level_only=entry_level_only,
+            match_mode=match_mode,
+            title_synonym_groups=title_synonym_groups,
+        )
+        if reason is not None:
+            return reason
+        if _posted_before_cutoff(job.get("posted_at"), max_days_since_posted, cutoff):
+            return "recency"
+
     # --- Location check -------------------------------------------------------
     combined_for_loc = f"{title_dept} {_normalize(location_str)}"
     if allow_empty_location and not location_str.strip():
@@ -378,19 +529,19 @@ def filter_failure_reason(
     ):
         return "location_field"
 
-    # --- Level / title --------------------------------------------------------
-    if entry_level_only and not _matches_any(title_dept, level_keywords, mode=match_mode):
-        return "entry_level"
-    if not (
-        _matches_any(title_dept, title_keywords, mode=match_mode)
-        or _title_matches_synonyms(title_dept, title_synonym_groups)
-    ):
-        return "title_keywords"
-
-    # --- Exclude --------------------------------------------------------------
-    exclude = exclude_keywords if exclude_keywords is not None else DEFAULT_EXCLUDE_KEYWORDS
-    if _contains_any(title_dept, exclude, mode=match_mode):
-        return "exclude_keywords"
+    # --- Level / title / exclude ----------------------------------------------
+    if not fail_fast:
+        reason = _title_stage_failure(
+            title_dept,
+            level_keywords,
+            title_keywords,
+            exclude_keywords,
+            entry_level_only=entry_level_only,
+            match_mode=match_mode,
+            title_synonym_groups=title_synonym_groups,
+        )
+        if reason is not None:
+            return reason
 
     # --- JD experience (skip for rescued new-grad titles) --------------------
     if use_jd_experience_filter:
@@ -405,12 +556,8 @@ def filter_failure_reason(
                 return "jd_experience"
 
     # --- Recency --------------------------------------------------------------
-    if max_days_since_posted is not None and max_days_since_posted > 0:
-        posted = _parse_posted_at(job.get("posted_at"))
-        if posted is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=max_days_since_posted)
-            if posted < cutoff:
-                return "recency"
+    if not fail_fast and _posted_before_cutoff(job.get("posted_at"), max_days_since_posted, cutoff):
+        return "recency"
     return None
 
 
@@ -432,6 +579,7 @@ def passes_filters(
     allow_title_canada_signal: bool = True,
     newgrad_title_rescue: bool = True,
     max_yoe_accept: int = 3,
+    cutoff: datetime | None = None,
 ) -> bool:
     """Return True if job passes all filters (new-grad only, no senior/staff, optional recency)."""
     return (
@@ -453,13 +601,15 @@ def passes_filters(
             allow_title_canada_signal=allow_title_canada_signal,
             newgrad_title_rescue=newgrad_title_rescue,
             max_yoe_accept=max_yoe_accept,
+            cutoff=cutoff,
+            fail_fast=True,
         )
         is None
     )
 
 
 def filter_jobs(
-    jobs: list[dict[str, Any]],
+    jobs: Iterable[dict[str, Any]],
     locations: list[str],
     level_keywords: list[str],
     title_keywords: list[str],
@@ -483,6 +633,9 @@ def filter_jobs(
     non_str_idx = [i for i, x in enumerate(locations) if not isinstance(x, str)]
     _debug_log("cad17e", "filters.py:filter_jobs", "locations list types", {"types": loc_types, "non_str_indices": non_str_idx, "len": len(locations)}, "A")
     # #endregion
+    cutoff = None
+    if max_days_since_posted is not None and max_days_since_posted > 0:
+        cutoff = _recency_cutoff(max_days_since_posted)
     return [
         j
         for j in jobs
@@ -504,5 +657,6 @@ def filter_jobs(
             allow_title_canada_signal=allow_title_canada_signal,
             newgrad_title_rescue=newgrad_title_rescue,
             max_yoe_accept=max_yoe_accept,
+            cutoff=cutoff,
         )
     ]
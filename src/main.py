@@ -6,12 +6,21 @@ Run once: python -m src.main
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from urllib.parse import urlparse, urlunparse
 
-from src.config import DISCORD_REVIEW_WEBHOOK_URL, load_db_cleanup, load_filters, load_watchlist
+from src.config import (
+    ATS_REDETECT_DAYS,
+    DISCORD_REVIEW_WEBHOOK_URL,
+    load_db_cleanup,
+    load_filters,
+    load_watchlist,
+)
 from src.db import (
     finish_run,
+    get_detected_ats,
+    get_interrupted_run_start,
     get_jobs_for_companies,
     get_new_jobs_since,
     has_notified_key,
@@ -19,12 +28,13 @@ from src.db import (
     remember_notified_keys,
     run_database_cleanup,
     start_run,
+    transaction,
     upsert_company,
-    upsert_job,
+    upsert_jobs_bulk,
 )
-from src.ats import fetch_jobs_for_company
+from src.ats import MAX_FETCH_WORKERS, Job, fetch_jobs_for_company
 from src.ats.resolve import resolve_ats_for_entry
-from src.filters import filter_jobs
+from src.filters import filter_jobs, level_prefilter_terms
 from src.keywords import annotate_with_keywords
 from src.notify import send_discord_new_jobs, send_discord_review_jobs
 from src.scoring import rank_jobs
@@ -80,68 +90,147 @@ def _normalize_external_id(external_id: str, job_url: str | None) -> str:
     return s
 
 
+def _resolve_and_fetch(
+    entry: dict,
+    detected: dict[str, tuple[str, str]],
+) -> tuple[str | None, str | None, str, list[Job]]:
+    """
+    Resolve one watchlist entry's ATS and fetch its jobs (no DB access; runs on a worker).
+    detected: recent auto-detections from get_detected_ats, reused instead of re-probing
+    entries that don't pin ats_type/board_id. Returns (ats_type, board_id, source, jobs), where
+    source is "pinned", "cached" or "probed", or "failed" when resolution raised.
+    Errors are logged and cost only this entry: a failed fetch returns no jobs, and a failed
+    resolve returns source "failed" so run_once leaves the stored company row alone.
+    """
+    name = entry.get("name") or "?"
+    careers_url = (entry.get("careers_url") or "").strip()
+    if entry.get("ats_type") and entry.get("board_id"):
+        source = "pinned"
+    elif careers_url in detected:
+        source = "cached"
+    else:
+        source = "probed"
+    if source == "cached":
+        ats_type, board_id = detected[careers_url]
+    else:
+        try:
+            ats_type, board_id = resolve_ats_for_entry(entry)
+        except Exception as e:
+            print(f"[warn] resolve failed: {name}: {e}", flush=True)
+            return None, None, "failed", []
+    try:
+        jobs = fetch_jobs_for_company(ats_type, board_id, careers_url)
+    except Exception as e:
+        print(f"[warn] fetch failed: {name}: {e}", flush=True)
+        jobs = []
+    return ats_type, board_id, source, jobs
+
+
 def run_once() -> None:
     """One full cycle: scrape all companies, upsert, filter new jobs, notify."""
     init_db()
     companies = load_watchlist()
     filters = load_filters()
     run_id = start_run()
-    run_started = datetime.now(timezone.utc)
     companies_checked = 0
     new_count = 0
     backfill_company_ids: list[int] = []
+    # New rows are known from the upserts themselves, so they aren't read back from SQLite.
+    new_jobs: list[dict] = []
+    # Every row upserted this run shares one timestamp, so a row is still reported new when a
+    # second watchlist entry with the same careers_url upserts it again; collect it once.
+    seen_job_ids: set[int] = set()
+    # company_id -> (name, ats_type, board_id) as stored: entries sharing a careers_url share
+    # one row, which keeps the last entry's values.
+    company_info: dict[int, tuple[str, str | None, str | None]] = {}
 
-    for entry in companies:
-        name = entry.get("name") or "Unknown"
-        careers_url = (entry.get("careers_url") or "").strip()
-        if not careers_url:
-            continue
-        ats_type, board_id = resolve_ats_for_entry(entry)
-        company_id, ats_changed = upsert_company(
-            name=name,
-            careers_url=careers_url,
-            ats_type=ats_type,
-            board_id=board_id,
-        )
-        if ats_changed:
-            backfill_company_ids.append(company_id)
-            print(
-                f"[info] ATS config changed for {name}: backfill alerts enabled "
-                f"(ats={ats_type or 'unknown'} board={board_id or '-'})",
-                flush=True,
-            )
-        companies_checked += 1
-        jobs = fetch_jobs_for_company(ats_type, board_id, careers_url)
-        # Surface zero-job companies so CI logs catch silent watchlist rot.
-        if not jobs:
-            print(f"[warn] 0-jobs: {name} (ats={ats_type or 'unknown'} board={board_id or '-'})", flush=True)
-        for j in jobs:
-            raw_id = j.get("id")
-            if raw_id is None:
-                raw_id = j.get("url") or ""
-            external_id = _normalize_external_id(str(raw_id).strip(), j.get("url"))
-            if not external_id:
-                continue
-            posted_at = j.get("posted_at")
-            if posted_at is not None:
-                posted_at = str(posted_at).strip() or None
-            _, is_new = upsert_job(
-                company_id=company_id,
-                external_id=external_id,
-                title=j.get("title"),
-                location=j.get("location"),
-                department=j.get("department"),
-                url=j.get("url"),
-                posted_at=posted_at,
-                description=j.get("description"),
+    entries = [e for e in companies if (e.get("careers_url") or "").strip()]
+    # Resolution and fetching are network-bound and independent per company, so they run on
+    # threads; every DB write stays on this thread, in one transaction after all fetches finish.
+    detected = get_detected_ats(ATS_REDETECT_DAYS)
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        fetched = list(pool.map(lambda e: _resolve_and_fetch(e, detected), entries))
+    # One timestamp for every row this run writes (last_seen_at, first_seen_at, detected_at).
+    now = datetime.now(timezone.utc).isoformat()
+
+    with transaction():
+        for entry, (ats_type, board_id, source, jobs) in zip(entries, fetched):
+            if source == "failed":
+                continue  # unresolved: keep the stored ATS instead of overwriting it with None
+            name = entry.get("name") or "Unknown"
+            careers_url = (entry.get("careers_url") or "").strip()
+            company_id, ats_changed = upsert_company(
+                name=name,
+                careers_url=careers_url,
+                ats_type=ats_type,
+                board_id=board_id,
+                detected_at=now if source == "probed" else None,
+                now=now,
+                pinned=source == "pinned",
             )
-            if is_new:
-                new_count += 1
+            company_info[company_id] = (name, ats_type, board_id)
+            if ats_changed:
+                backfill_company_ids.append(company_id)
+                print(
+                    f"[info] ATS config changed for {name}: backfill alerts enabled "
+                    f"(ats={ats_type or 'unknown'} board={board_id or '-'})",
+                    flush=True,
+                )
+            companies_checked += 1
+            # Surface zero-job companies so CI logs catch silent watchlist rot.
+            if not jobs:
+                print(f"[warn] 0-jobs: {name} (ats={ats_type or 'unknown'} board={board_id or '-'})", flush=True)
+            rows: dict[str, tuple] = {}
+            for j in jobs:
+                raw_id = j.id
+                if raw_id is None:
+                    raw_id = j.url or ""
+                external_id = _normalize_external_id(str(raw_id).strip(), j.url)
+                if not external_id:
+                    continue
+                posted_at = j.posted_at
+                if posted_at is not None:
+                    posted_at = str(posted_at).strip() or None
+                rows[external_id] = (external_id, j.title, j.location, j.department, j.url, posted_at, j.description)
+            upserted = upsert_jobs_bulk(company_id, list(rows.values()), now=now)
+            for row, (job_id, is_new) in zip(rows.values(), upserted):
+                if is_new and job_id not in seen_job_ids:
+                    seen_job_ids.add(job_id)
+                    external_id, title, location, department, url, posted_at, description = row
+                    new_jobs.append(
+                        {
+                            "id": job_id,
+                            "company_id": company_id,
+                            "external_id": external_id,
+                            "title": title,
+                            "location": location,
+                            "department": department,
+                            "url": url,
+                            "posted_at": posted_at,
+                            "description": description,
+                        }
+                    )
+                    new_count += 1
+
+    for j in new_jobs:
+        j["company_name"], j["ats_type"], j["board_id"] = company_info[j["company_id"]]
+
+    # A run that died before finish_run may not have notified its new rows; they are no
+    # longer new, so read them back. has_notified_key still drops any it did send.
+    interrupted_since = get_interrupted_run_start(run_id)
+    if interrupted_since is not None:
+        for job in get_new_jobs_since(interrupted_since):
+            if job["id"] not in seen_job_ids:
+                new_jobs.append(job)
+                seen_job_ids.add(job["id"])
 
-    new_jobs = get_new_jobs_since(run_started)
     if backfill_company_ids:
-        seen_job_ids = {j["id"] for j in new_jobs}
-        for job in get_jobs_for_companies(backfill_company_ids):
+        # Backfill rows that can't pass the level check never leave SQLite; filter_jobs still
+        # runs on the rest.
+        level_terms = level_prefilter_terms(
+            filters["level_keywords"], entry_level_only=filters.get("entry_level_only", True)
+        )
+        for job in get_jobs_for_companies(backfill_company_ids, title_dept_terms=level_terms):
             if job["id"] not in seen_job_ids:
                 new_jobs.append(job)
                 seen_job_ids.add(job["id"])
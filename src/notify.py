@@ -1,12 +1,17 @@
 """Discord webhook notifications for new jobs."""
 
+import time
+
 import requests
 from typing import Any
 
+from src.ats._http import SESSION
 from src.config import DISCORD_REVIEW_WEBHOOK_URL, DISCORD_WEBHOOK_URL
 
 # Discord allows up to 10 embeds per message; we batch to avoid rate limits
 EMBEDS_PER_MESSAGE = 10
+# Upper bound on any single rate-limit sleep, so a bogus header can't stall a run.
+MAX_RATE_LIMIT_WAIT = 30.0
 
 
 def _embed_for_job(job: dict[str, Any], *, review_queue: bool = False) -> dict[str, Any]:
@@ -60,6 +65,39 @@ def _embed_for_job(job: dict[str, Any], *, review_queue: bool = False) -> dict[s
     return embed
 
 
+def _header_seconds(r: requests.Response, name: str) -> float:
+    """Seconds from a rate-limit header, clamped to [0, MAX_RATE_LIMIT_WAIT]; 1s if unparseable."""
+    try:
+        return min(max(float(r.headers.get(name, 1.0)), 0.0), MAX_RATE_LIMIT_WAIT)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _post_embeds(url: str, embeds: list[dict[str, Any]]) -> bool:
+    """
+    POST embeds to a webhook in messages of EMBEDS_PER_MESSAGE, one at a time so alerts keep
+    their ranked order. Waits out an exhausted bucket (X-RateLimit-Remaining: 0) before the
+    next message, and retries a 429 once after Retry-After. Returns False on any failure.
+    """
+    wait = 0.0
+    for i in range(0, len(embeds), EMBEDS_PER_MESSAGE):
+        if wait:
+            time.sleep(wait)
+        payload = {"content": None, "embeds": embeds[i : i + EMBEDS_PER_MESSAGE]}
+        try:
+            r = SESSION.post(url, json=payload, timeout=10)
+            if r.status_code == 429:
+                time.sleep(_header_seconds(r, "Retry-After"))
+                r = SESSION.post(url, json=payload, timeout=10)
+            r.raise_for_status()
+        except requests.RequestException:
+            return False
+        wait = 0.0
+        if r.headers.get("X-RateLimit-Remaining") == "0":
+            wait = _header_seconds(r, "X-RateLimit-Reset-After")
+    return True
+
+
 def send_discord_new_jobs(jobs: list[dict[str, Any]]) -> bool:
     """
     Send new job alerts to Discord. Batches into messages of up to 10 embeds.
@@ -70,22 +108,7 @@ def send_discord_new_jobs(jobs: list[dict[str, Any]]) -> bool:
     if not jobs:
         return True
     embeds = [_embed_for_job(j) for j in jobs]
-    for i in range(0, len(embeds), EMBEDS_PER_MESSAGE):
-        chunk = embeds[i : i + EMBEDS_PER_MESSAGE]
-        payload = {
-            "content": None,
-            "embeds": chunk,
-        }
-        try:
-            r = requests.post(
-                DISCORD_WEBHOOK_URL,
-                json=payload,
-                timeout=10,
-            )
-            r.raise_for_status()
-        except requests.RequestException:
-            return False
-    return True
+    return _post_embeds(DISCORD_WEBHOOK_URL, embeds)
 
 
 def send_discord_review_jobs(jobs: list[dict[str, Any]]) -> bool:
@@ -99,12 +122,4 @@ def send_discord_review_jobs(jobs: list[dict[str, Any]]) -> bool:
     if not jobs:
         return True
     embeds = [_embed_for_job(j, review_queue=True) for j in jobs]
-    for i in range(0, len(embeds), EMBEDS_PER_MESSAGE):
-        chunk = embeds[i : i + EMBEDS_PER_MESSAGE]
-        payload = {"content": None, "embeds": chunk}
-        try:
-            r = requests.post(url, json=payload, timeout=10)
-            r.raise_for_status()
-        except requests.RequestException:
-            return False
-    return True
+    return _post_embeds(url, embeds)